@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for verify-test-coverage.py that don't need cargo-llvm-cov installed.
+
+Usage:
+    python3 -m unittest discover -s scripts -p 'test_*.py'
+"""
+
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+def load_coverage_script():
+    """Import verify-test-coverage.py, whose name is not a valid module name."""
+    path = Path(__file__).with_name('verify-test-coverage.py')
+    spec = importlib.util.spec_from_file_location('verify_test_coverage', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+coverage = load_coverage_script()
+
+
+class FakeCargo:
+    """Stands in for subprocess.run, behaving like cargo and the test binaries.
+
+    Like cargo, `llvm-cov clean --workspace` deletes the test binaries and
+    `test --no-run` only builds the ones that are missing. Every test binary
+    run is recorded and writes a profile to its LLVM_PROFILE_FILE.
+    """
+
+    def __init__(self, root):
+        self.profile_dir = root / 'target' / 'llvm-cov-target'
+        self.binary = root / 'target' / 'llvm-cov-target' / 'debug' / 'deps' / 'multi_llm-abc'
+        self.binary_runs = []
+        self.builds = 0
+
+    def __call__(self, cmd, cwd=None, env=None, **kwargs):
+        stdout = ''
+        if cmd[:3] == ['cargo', 'llvm-cov', 'show-env']:
+            stdout = f"export LLVM_PROFILE_FILE='{self.profile_dir}/multi-llm-%p-%m.profraw'\n"
+        elif cmd[:3] == ['cargo', 'llvm-cov', 'clean']:
+            self.binary.unlink(missing_ok=True)
+        elif cmd[:2] == ['cargo', 'test']:
+            if not self.binary.exists():
+                self.binary.parent.mkdir(parents=True, exist_ok=True)
+                self.binary.write_bytes(b'instrumented test binary')
+                self.builds += 1
+            stdout = json.dumps({
+                'reason': 'compiler-artifact',
+                'profile': {'test': True},
+                'executable': str(self.binary),
+            }) + '\n'
+        elif cmd[0] == str(self.binary):
+            self.binary_runs.append(cmd)
+            profile = env['LLVM_PROFILE_FILE'].replace('%p', str(len(self.binary_runs))).replace('%m', '0')
+            Path(profile).write_bytes(b'profile data')
+        else:
+            raise AssertionError(f"unexpected command: {cmd}")
+        return subprocess.CompletedProcess(cmd, 0, stdout, '')
+
+
+class ReuseProfilesTest(unittest.TestCase):
+    def run_binaries(self, crate_path, fake):
+        with mock.patch('subprocess.run', fake), contextlib.redirect_stdout(io.StringIO()) as out:
+            env = coverage.run_binaries_in_parallel(crate_path, False, [], 60, dict(os.environ), reuse_profiles=True)
+        self.assertIsNotNone(env)
+        return out.getvalue()
+
+    def test_second_run_with_unchanged_sources_reuses_cached_profiles(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            crate_path = Path(tmp)
+            fake = FakeCargo(crate_path)
+
+            first = self.run_binaries(crate_path, fake)
+            self.assertIn('Reused coverage profiles for 0 of 1 test binaries', first)
+            self.assertEqual(len(fake.binary_runs), 1)
+
+            second = self.run_binaries(crate_path, fake)
+            self.assertIn('Reused coverage profiles for 1 of 1 test binaries', second)
+            self.assertEqual(len(fake.binary_runs), 1)
+            self.assertEqual(fake.builds, 1)
+
+            # The cached profile stands in for the run that was skipped
+            profiles = list(fake.profile_dir.glob('*.profraw'))
+            self.assertEqual([p.name for p in profiles], ['multi_llm-abc-1-0.profraw'])
+
+    def test_stale_profiles_are_removed_before_running(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            crate_path = Path(tmp)
+            fake = FakeCargo(crate_path)
+            fake.profile_dir.mkdir(parents=True)
+            (fake.profile_dir / 'old-1-0.profraw').write_bytes(b'stale')
+            (fake.profile_dir / 'multi-llm.profdata').write_bytes(b'stale')
+
+            self.run_binaries(crate_path, fake)
+
+            self.assertEqual(sorted(p.name for p in fake.profile_dir.iterdir() if p.is_file()),
+                             ['multi_llm-abc-1-0.profraw'])
+
+
+if __name__ == '__main__':
+    unittest.main()
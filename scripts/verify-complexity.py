@@ -27,41 +27,97 @@ import argparse
 import subprocess
 
 
+METRICS_PACKAGE = 'verify-rust-metrics'
+
+# The project root (where Cargo.toml is) is the parent of this scripts directory
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+
+
+def metrics_binary_is_current(binary, project_root):
+    """Check if binary is newer than everything the metrics tool is built from.
+
+    That is the tool crate's sources and manifest (a workspace member named
+    after the package) plus the workspace Cargo.toml and Cargo.lock. When the
+    crate is not found there, the binary is treated as stale so cargo decides.
+    """
+    try:
+        built = os.stat(binary).st_mtime_ns
+    except OSError:
+        return False
+
+    crate_dir = os.path.join(project_root, METRICS_PACKAGE)
+    if not os.path.isfile(os.path.join(crate_dir, 'Cargo.toml')):
+        return False
+
+    inputs = [
+        os.path.join(crate_dir, 'Cargo.toml'),
+        os.path.join(project_root, 'Cargo.toml'),
+        os.path.join(project_root, 'Cargo.lock'),
+    ]
+    for root, _, files in os.walk(os.path.join(crate_dir, 'src')):
+        inputs.extend(os.path.join(root, name) for name in files)
+
+    for path in inputs:
+        try:
+            if os.stat(path).st_mtime_ns > built:
+                return False
+        except FileNotFoundError:
+            continue
+    return True
+
+
+def resolve_metrics_binary(project_root):
+    """Return the path of the release verify-rust-metrics binary, or None.
+
+    The binary is exec'd directly instead of going through `cargo run`. It is
+    only rebuilt with `cargo build --release` when it is missing or older than
+    the tool's sources; None means that build failed.
+    """
+    exe = METRICS_PACKAGE + ('.exe' if os.name == 'nt' else '')
+    binary = os.path.join(project_root, 'target', 'release', exe)
+    if metrics_binary_is_current(binary, project_root):
+        return binary
+
+    try:
+        result = subprocess.run(
+            ['cargo', 'build', '--release', '-p', METRICS_PACKAGE],
+            cwd=project_root,
+            stdout=sys.stderr
+        )
+    except OSError:
+        return None
+
+    if result.returncode != 0:
+        return None
+
+    return binary if os.path.isfile(binary) else None
+
+
 def run_rust_tool(crate_path, goal, hard_limit):
     """Run the Rust-based verification tool."""
-    # Find the project root (where Cargo.toml is)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)
-
     # Build the crate path relative to project root
     if os.path.isabs(crate_path):
         abs_crate_path = crate_path
     else:
-        abs_crate_path = os.path.join(project_root, crate_path)
+        abs_crate_path = os.path.join(PROJECT_ROOT, crate_path)
 
-    # Run the Rust tool
-    cmd = [
-        'cargo', 'run', '--release', '-p', 'verify-rust-metrics',
-        '--',
+    tool_args = [
         abs_crate_path,
         '--complexity-goal', str(goal),
         '--complexity-hard', str(hard_limit)
     ]
 
-    try:
-        result = subprocess.run(
-            cmd,
-            cwd=project_root,
-            capture_output=True,
-            text=True
-        )
-
-        # Print the tool's output
-        if result.stdout:
-            print(result.stdout, end='')
-        if result.stderr:
-            print(result.stderr, end='', file=sys.stderr)
+    # Run the built binary directly; when its build just failed, cargo run
+    # would only repeat that build
+    binary = resolve_metrics_binary(PROJECT_ROOT)
+    if binary is None:
+        return None
+    cmd = [binary] + tool_args
 
+    try:
+        # The tool's output goes straight to our stdout/stderr
+        result = subprocess.run(cmd, cwd=PROJECT_ROOT)
         return result.returncode
 
     except Exception as e:
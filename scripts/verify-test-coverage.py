@@ -32,6 +32,18 @@ Examples:
     # Include integration tests with detailed file view
     python3 scripts/verify-test-coverage.py --include-integration --show-files
 
+    # Run each test binary concurrently and merge the coverage afterwards
+    python3 scripts/verify-test-coverage.py --include-integration --parallel-binaries
+
+    # Report the last run's coverage again without running any tests
+    python3 scripts/verify-test-coverage.py --report-only --show-uncovered
+
+    # Only rerun test binaries that changed since the last passing run
+    python3 scripts/verify-test-coverage.py --reuse-profiles
+
+    # Run tests serially (e.g., when integration tests hit rate limits)
+    python3 scripts/verify-test-coverage.py --include-integration --test-threads 1
+
 Exit codes:
     0 - Coverage meets goal threshold
     1 - Coverage meets minimum but not goal (warning)
@@ -41,15 +53,64 @@ Exit codes:
 
 import sys
 import os
-import re
 import argparse
 import subprocess
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterable, List, Tuple
+
+
+# Coverage profiles of earlier test binary runs, relative to the crate
+PROFILE_CACHE_DIR = Path('target') / 'llvm-cov-cache'
+
+# What the last full coverage run covered, so its data can be reported again
+LAST_RUN_STAMP = PROFILE_CACHE_DIR / 'last-run.json'
+
+# Where cargo-llvm-cov keeps the merged profile data, relative to the crate
+PROFDATA_DIR = Path('target') / 'llvm-cov-target'
+
+# Inputs that decide what the tests cover
+COVERAGE_INPUTS = ['src', 'tests', 'Cargo.toml', 'Cargo.lock']
+
+# Remembers that cargo-llvm-cov was found, so the check can skip spawning cargo
+LLVM_COV_CHECK_CACHE = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'multi-llm-cov' / 'llvm-cov-version'
+LLVM_COV_CHECK_MAX_AGE = 24 * 60 * 60
+
+# Module groups in the per-file report; a file goes under the first one in its path
+COMMON_MODULES = ('billing/', 'domain/', 'executor/', 'llm/', 'storage/', 'tools/', 'agents/')
+
+# Lines of the text report table that are not per-file rows
+NON_FILE_ROW_PREFIXES = ('Filename', 'TOTAL', '-')
+
+
+def llvm_cov_tool_stamp() -> List:
+    """Identify the installed cargo and cargo-llvm-cov executables by path and mtime."""
+    import shutil
+
+    stamp = []
+    for tool in ('cargo', 'cargo-llvm-cov'):
+        path = shutil.which(tool)
+        stamp.append([path, os.stat(path).st_mtime_ns if path else None])
+    return stamp
 
 
 def check_llvm_cov_installed() -> bool:
-    """Check if cargo-llvm-cov is installed."""
+    """Check if cargo-llvm-cov is installed.
+
+    A successful check is remembered in LLVM_COV_CHECK_CACHE for a day, as
+    long as the cargo and cargo-llvm-cov executables on PATH are unchanged.
+    """
+    import json
+    import time
+
+    stamp = llvm_cov_tool_stamp()
+    try:
+        if time.time() - LLVM_COV_CHECK_CACHE.stat().st_mtime < LLVM_COV_CHECK_MAX_AGE:
+            with open(LLVM_COV_CHECK_CACHE, 'r') as f:
+                if json.load(f).get('tools') == stamp:
+                    return True
+    except (OSError, ValueError, AttributeError):
+        pass
+
     try:
         result = subprocess.run(
             ['cargo', 'llvm-cov', '--version'],
@@ -57,10 +118,20 @@ def check_llvm_cov_installed() -> bool:
             text=True,
             timeout=10
         )
-        return result.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return False
 
+    if result.returncode != 0:
+        return False
+
+    try:
+        LLVM_COV_CHECK_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(LLVM_COV_CHECK_CACHE, 'w') as f:
+            json.dump({'tools': stamp, 'version': result.stdout.strip()}, f)
+    except OSError:
+        pass
+    return True
+
 
 def parse_coverage_line(line: str) -> Optional[Dict[str, float]]:
     """Parse a single coverage summary line from llvm-cov output."""
@@ -85,82 +156,469 @@ def parse_coverage_line(line: str) -> Optional[Dict[str, float]]:
     return None
 
 
-def parse_file_coverage(lines: List[str]) -> Dict[str, Dict[str, float]]:
-    """Parse per-file coverage from llvm-cov output."""
-    files = {}
+def parse_file_coverage(line: str) -> Optional[Tuple[str, float]]:
+    """Parse a per-file row from llvm-cov output into (filename, line coverage)."""
+    # Skip header and total lines
+    if line.startswith(NON_FILE_ROW_PREFIXES):
+        return None
 
-    for line in lines:
-        # Skip header and total lines
-        if line.startswith('Filename') or line.startswith('TOTAL') or line.startswith('-'):
-            continue
+    parts = line.split()
+    if len(parts) >= 13:
+        try:
+            return parts[0], float(parts[9].rstrip('%'))
+        except (ValueError, IndexError):
+            pass
+    return None
 
-        parts = line.split()
-        if len(parts) >= 13:
-            try:
-                filename = parts[0]
-                line_cov = float(parts[9].rstrip('%'))
 
-                files[filename] = {
-                    'line': line_cov,
+def parse_json_report(output: str, want_files: bool = True) -> Tuple[Optional[Dict[str, float]], Dict[str, Dict[str, float]]]:
+    """Parse overall and per-file coverage from llvm-cov JSON export output.
+
+    File names are made relative to their common directory, as in the text
+    report. Files without any lines are skipped, matching the text report's
+    '-' entries. Without want_files only the totals are read.
+    """
+    import json
+
+    try:
+        data = json.loads(output)['data'][0]
+        totals = data['totals']
+        coverage = {
+            'region': totals['regions']['percent'],
+            'function': totals['functions']['percent'],
+            'line': totals['lines']['percent'],
+        }
+        entries = data['files']
+    except (ValueError, KeyError, IndexError, TypeError):
+        return None, {}
+
+    files = {}
+    if want_files and entries:
+        root = os.path.commonpath([os.path.dirname(entry['filename']) for entry in entries])
+        for entry in entries:
+            lines = entry['summary']['lines']
+            if lines['count']:
+                files[os.path.relpath(entry['filename'], root)] = {
+                    'line': lines['percent'],
                 }
-            except (ValueError, IndexError):
-                pass
 
-    return files
+    return coverage, files
 
 
-def parse_uncovered_lines(lines: List[str]) -> Dict[str, List[int]]:
-    """Parse uncovered lines section from llvm-cov --show-missing-lines output.
+def parse_uncovered_lines(line: str) -> Optional[Tuple[str, List[Tuple[int, int]]]]:
+    """Parse one entry of the uncovered lines section from llvm-cov --show-missing-lines output.
 
-    Returns a dict mapping file paths to lists of uncovered line numbers.
+    Returns the file path and its uncovered lines as inclusive (start, end)
+    ranges, so a long range is never expanded into every line number.
     Example output format:
         Uncovered Lines:
         /Users/rick/git/multi-llm/multi-llm/src/coordinator/agent.rs: 56, 57, 58, 78-82
     """
-    uncovered = {}
-    in_uncovered_section = False
+    # Parse lines like: "/path/to/file.rs: 56, 57, 78-82, 100"
+    if ':' not in line:
+        return None
+
+    filepath, line_nums_str = line.split(':', 1)
+    filepath = filepath.strip()
+
+    # Parse line numbers (handles both single numbers and ranges); int()
+    # ignores surrounding whitespace, so parts need no strip()
+    line_ranges = []
+    for part in line_nums_str.split(','):
+        start, dash, end = part.partition('-')
+        try:
+            if dash:
+                # Range like "78-82"
+                line_ranges.append((int(start), int(end)))
+            else:
+                # Single line number
+                line = int(part)
+                line_ranges.append((line, line))
+        except ValueError:
+            pass
+
+    if line_ranges:
+        return filepath, line_ranges
+    return None
+
+
+def parse_text_report(lines: Iterable[str], want_uncovered: bool) -> Tuple[Optional[Dict[str, float]], Dict[str, Dict[str, float]], Optional[Dict[str, List[Tuple[int, int]]]]]:
+    """Parse overall, per-file and (optionally) uncovered lines from the text report in one pass.
+
+    Takes any iterable of lines, so the report can be parsed while llvm-cov
+    is still writing it. The report is read as a sequence of sections, so
+    each line is only checked against the section it belongs to:
+
+        header    (test output)  until the 'Filename' table header
+        files     per-file rows  until the TOTAL row
+        totals    anything       until 'Uncovered Lines:'
+        uncovered one 'path: line numbers' entry per line
+    """
+    coverage = None
+    files = {}
+    uncovered = {} if want_uncovered else None
+    section = 'header'
 
     for line in lines:
-        if 'Uncovered Lines:' in line:
-            in_uncovered_section = True
-            continue
+        if section == 'files':
+            if line.startswith('TOTAL'):
+                coverage = parse_coverage_line(line)
+                if coverage:
+                    section = 'totals'
+                continue
+
+            file_cov = parse_file_coverage(line)
+            if file_cov:
+                filename, line_cov = file_cov
+                files[filename] = {
+                    'line': line_cov,
+                }
+
+        elif section == 'header':
+            if line.startswith('Filename'):
+                section = 'files'
 
-        if not in_uncovered_section:
+        elif section == 'totals':
+            if want_uncovered and line.startswith('Uncovered Lines:'):
+                section = 'uncovered'
+
+        else:
+            entry = parse_uncovered_lines(line)
+            if entry:
+                uncovered[entry[0]] = entry[1]
+
+    return coverage, files, uncovered
+
+
+def is_fatal_cargo_error(stderr: str) -> bool:
+    """Check if cargo stderr contains actual errors (not just warnings)."""
+    stderr_lower = stderr.lower()
+    return any(marker in stderr_lower for marker in [
+        'error: could not compile',
+        'error: failed to',
+        'error: no such',
+        'could not compile',
+    ])
+
+
+def check_cargo_result(result: subprocess.CompletedProcess) -> bool:
+    """Report a failed cargo step; return False only if the failure is fatal."""
+    # cargo-llvm-cov may output warnings to stderr even on success
+    if result.returncode != 0:
+        # Only fail if returncode is non-zero AND we have actual error output
+        if is_fatal_cargo_error(result.stderr):
+            print("Error running coverage analysis:", file=sys.stderr)
+            print(result.stderr, file=sys.stderr)
+            return False
+        # If returncode is non-zero but no fatal errors, treat as warning
+        elif result.stderr:
+            print("Warning from cargo-llvm-cov:", file=sys.stderr)
+            print(result.stderr, file=sys.stderr)
+    return True
+
+
+def parse_export_lines(output: str) -> Dict[str, str]:
+    """Parse `export KEY=value` lines from cargo llvm-cov show-env --export-prefix."""
+    import shlex
+
+    env = {}
+    for line in output.splitlines():
+        words = shlex.split(line)
+        if len(words) == 2 and words[0] == 'export' and '=' in words[1]:
+            key, value = words[1].split('=', 1)
+            env[key] = value
+    return env
+
+
+def find_test_binaries(cargo_output: str) -> List[str]:
+    """Extract test executables from cargo test --no-run --message-format=json output."""
+    import json
+
+    binaries = []
+    for line in cargo_output.splitlines():
+        if not line.startswith('{'):
             continue
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if (message.get('reason') == 'compiler-artifact' and
+                message.get('profile', {}).get('test') and
+                message.get('executable')):
+            binaries.append(message['executable'])
+    return binaries
+
+
+def run_test_binary(binary: str, test_args: List[str], cwd: Path, env: Dict[str, str], timeout: int) -> subprocess.CompletedProcess:
+    """Run one instrumented test binary."""
+    return subprocess.run(
+        [binary] + test_args,
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        env=env
+    )
+
+
+def profile_cache_key(binary: str, test_args: List[str]) -> str:
+    """Identify a test binary build and the arguments it is run with.
+
+    A rebuild (including one caused by a Cargo.lock change) changes the
+    binary's mtime and usually its size, so the key changes with it. Binaries
+    are kept between runs (see remove_stale_profiles), so an unchanged one
+    keeps its key.
+    """
+    # Only needed with --reuse-profiles; skip the imports on other runs
+    import hashlib
+    import json
+
+    st = os.stat(binary)
+    digest = hashlib.sha256(json.dumps([st.st_mtime_ns, st.st_size, test_args]).encode()).hexdigest()
+    return f"{os.path.basename(binary)}-{digest[:16]}"
+
+
+def restore_cached_profiles(cache_dir: Path, profile_dir: str) -> bool:
+    """Copy a binary's cached profiles into the profile directory, if there are any."""
+    import glob
+    import shutil
+
+    cached = glob.glob(os.path.join(cache_dir, '*.profraw'))
+    for path in cached:
+        shutil.copy2(path, profile_dir)
+    return bool(cached)
+
+
+def store_cached_profiles(cache_root: Path, key: str, binary: str, profile_dir: str):
+    """Save the profiles a binary just wrote, replacing older entries for that binary."""
+    import glob
+    import shutil
+
+    name = os.path.basename(binary)
+    for old in glob.glob(os.path.join(cache_root, f'{glob.escape(name)}-*')):
+        shutil.rmtree(old, ignore_errors=True)
+
+    cache_dir = cache_root / key
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for path in glob.glob(os.path.join(profile_dir, f'{glob.escape(name)}-*.profraw')):
+        shutil.copy2(path, cache_dir)
+
+
+def remove_stale_profiles(profile_dir: str):
+    """Delete the raw and merged profiles earlier runs left in profile_dir.
+
+    Unlike cargo llvm-cov clean --workspace, this keeps the instrumented test
+    binaries, so cargo test --no-run does not rebuild unchanged ones.
+    """
+    import glob
+
+    for pattern in ('*.profraw', '*.profdata'):
+        for path in glob.glob(os.path.join(profile_dir, pattern)):
+            os.remove(path)
+
+
+def run_binaries_in_parallel(crate_path: Path, include_integration: bool, test_args: List[str], timeout: int, test_env: Dict[str, str], reuse_profiles: bool = False) -> Optional[Dict[str, str]]:
+    """Build instrumented test binaries and run them concurrently.
+
+    Follows the cargo-llvm-cov show-env workflow: the coverage environment is
+    exported, the test binaries are built with cargo test --no-run and every
+    binary runs in its own process (each writes its own profile). Returns the
+    coverage environment for the cargo llvm-cov report that merges them.
+
+    With reuse_profiles, each binary's profiles are kept in PROFILE_CACHE_DIR
+    and binaries that are unchanged since a passing run are not run again;
+    their cached profiles are used instead.
+    """
+    def run_step(cmd, env):
+        return subprocess.run(cmd, cwd=crate_path, capture_output=True, text=True, timeout=timeout, env=env)
+
+    result = run_step(['cargo', 'llvm-cov', 'show-env', '--export-prefix'], test_env)
+    if not check_cargo_result(result):
+        return None
+    cov_env = dict(test_env, **parse_export_lines(result.stdout))
 
-        # Parse lines like: "/path/to/file.rs: 56, 57, 78-82, 100"
-        if ':' in line:
-            parts = line.split(':', 1)
-            if len(parts) == 2:
-                filepath = parts[0].strip()
-                line_nums_str = parts[1].strip()
-
-                # Parse line numbers (handles both single numbers and ranges)
-                line_nums = []
-                for part in line_nums_str.split(','):
-                    part = part.strip()
-                    if '-' in part:
-                        # Range like "78-82"
-                        try:
-                            start, end = part.split('-')
-                            line_nums.extend(range(int(start), int(end) + 1))
-                        except ValueError:
-                            pass
-                    else:
-                        # Single line number
-                        try:
-                            line_nums.append(int(part))
-                        except ValueError:
-                            pass
-
-                if line_nums:
-                    uncovered[filepath] = line_nums
-
-    return uncovered
-
-
-def run_coverage(crate_path: Path, test_filter: Optional[str], html: bool, show_files: bool, include_integration: bool, show_uncovered: bool, timeout: int) -> Optional[str]:
-    """Run cargo-llvm-cov and return the output."""
+    # Stale profiles from earlier runs would be merged into the report
+    profile_dir = os.path.dirname(cov_env.get('LLVM_PROFILE_FILE', ''))
+    remove_stale_profiles(profile_dir or str(crate_path / PROFDATA_DIR))
+
+    build_cmd = ['cargo', 'test', '--no-run', '--message-format=json', '--lib']
+    if include_integration:
+        build_cmd.append('--tests')
+    result = run_step(build_cmd, cov_env)
+    if not check_cargo_result(result):
+        return None
+    binaries = find_test_binaries(result.stdout)
+
+    binary_envs = {binary: cov_env for binary in binaries}
+    cache_keys = {}
+    if reuse_profiles and profile_dir:
+        cache_root = crate_path / PROFILE_CACHE_DIR
+        os.makedirs(profile_dir, exist_ok=True)
+        reused = 0
+        for binary in binaries:
+            key = profile_cache_key(binary, test_args)
+            if restore_cached_profiles(cache_root / key, profile_dir):
+                del binary_envs[binary]
+                reused += 1
+                continue
+            # Name the profiles after the binary so they can be cached afterwards
+            name = os.path.basename(binary)
+            binary_envs[binary] = dict(cov_env, LLVM_PROFILE_FILE=os.path.join(profile_dir, f'{name}-%p-%m.profraw'))
+            cache_keys[binary] = key
+        print(f"Reused coverage profiles for {reused} of {len(binaries)} test binaries")
+
+    # concurrent.futures pulls in logging; only import it on this path
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Leave headroom for the test threads each binary starts itself
+    to_run = list(binary_envs)
+    workers = max(1, min(len(to_run), (os.cpu_count() or 1) - 2))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            lambda binary: run_test_binary(binary, test_args, crate_path, binary_envs[binary], timeout),
+            to_run
+        ))
+
+    for binary, result in zip(to_run, results):
+        if result.returncode != 0:
+            print(f"Warning: {os.path.basename(binary)} exited with status {result.returncode}", file=sys.stderr)
+            print(result.stderr or result.stdout, file=sys.stderr)
+        elif binary in cache_keys:
+            store_cached_profiles(crate_path / PROFILE_CACHE_DIR, cache_keys[binary], binary, profile_dir)
+
+    return cov_env
+
+
+def stream_text_report(cmd: List[str], cwd: Path, env: Dict[str, str], timeout: int, want_uncovered: bool):
+    """Run cmd and parse its text report from stdout as it is produced.
+
+    Returns (result, report) where result carries the return code and stderr;
+    stderr is drained on a separate thread so neither pipe can fill up.
+    Raises subprocess.TimeoutExpired if cmd runs longer than timeout.
+    """
+    import threading
+
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1024 * 1024,
+        env=env
+    )
+    stderr_chunks = []
+    drain = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+    drain.start()
+
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        with proc.stdout:
+            report = parse_text_report(proc.stdout, want_uncovered)
+        proc.wait()
+    finally:
+        timer.cancel()
+        # If parsing raised (or was interrupted), don't leave cargo running
+        # as an orphan; reap it as subprocess.run does before re-raising
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        drain.join()
+        proc.stderr.close()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    return subprocess.CompletedProcess(cmd, proc.returncode, None, ''.join(stderr_chunks)), report
+
+
+def clean_tree_head(crate_path: Path) -> Optional[str]:
+    """Return the HEAD commit if the crate's sources are exactly as committed, else None."""
+    def git(*args):
+        return subprocess.run(['git', '-C', str(crate_path)] + list(args), capture_output=True, text=True)
+
+    try:
+        head = git('rev-parse', 'HEAD')
+        if head.returncode != 0:
+            return None
+        if git('diff', '--quiet', 'HEAD', '--', *COVERAGE_INPUTS).returncode != 0:
+            return None
+        if git('ls-files', '--others', '--exclude-standard', '--', *COVERAGE_INPUTS).stdout.strip():
+            return None
+    except OSError:
+        return None
+    return head.stdout.strip()
+
+
+def coverage_run_stamp(crate_path: Path, include_integration: bool, test_args: List[str]) -> Optional[Dict]:
+    """Describe a coverage run of the committed sources, or None if there are local changes."""
+    head = clean_tree_head(crate_path)
+    if head is None:
+        return None
+    return {'head': head, 'include_integration': include_integration, 'test_args': test_args}
+
+
+def can_reuse_last_run(crate_path: Path, stamp: Optional[Dict]) -> bool:
+    """Check if the last full run's profile data was produced by the same run as stamp."""
+    import glob
+    import json
+
+    if stamp is None or not glob.glob(os.path.join(crate_path / PROFDATA_DIR, '*.profdata')):
+        return False
+    try:
+        with open(crate_path / LAST_RUN_STAMP, 'r') as f:
+            return json.load(f) == stamp
+    except (OSError, ValueError):
+        return False
+
+
+def write_last_run_stamp(crate_path: Path, stamp: Optional[Dict]):
+    """Record what the profile data now on disk covers; None forgets it."""
+    import json
+
+    path = crate_path / LAST_RUN_STAMP
+    try:
+        if stamp is None:
+            if path.exists():
+                path.unlink()
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(stamp, f)
+    except OSError:
+        pass
+
+
+def read_json_report(path: str) -> Optional[str]:
+    """Read the JSON report written via --output-path."""
+    try:
+        with open(path, 'r') as f:
+            return f.read()
+    except OSError as e:
+        print(f"Error: could not read coverage report {path}: {e}", file=sys.stderr)
+        return None
+
+
+def run_coverage(crate_path: Path, test_filter: Optional[str], html: bool, show_files: bool, include_integration: bool, show_uncovered: bool, timeout: int, test_threads: Optional[int] = None, parallel_binaries: bool = False, reuse_profiles: bool = False, report_only: bool = False, rerun_tests: bool = False):
+    """Run cargo-llvm-cov and return the parsed report.
+
+    With report_only, no tests are run: cargo llvm-cov report re-reads the
+    profile data left by the last run. That also happens automatically when
+    the last full run was of the same committed sources with the same test
+    options, unless rerun_tests is set.
+
+    Returns (coverage, files, uncovered) as read from llvm-cov's JSON summary
+    export or its text report, or None if the tool failed. coverage is None
+    if the report could not be parsed; uncovered is None unless
+    show_uncovered is set.
+    """
     if not crate_path.exists():
         print(f"Error: Crate path {crate_path} does not exist", file=sys.stderr)
         return None
@@ -175,21 +633,35 @@ def run_coverage(crate_path: Path, test_filter: Optional[str], html: bool, show_
     if include_integration:
         cmd.append('--tests')
 
-    if html:
-        cmd.append('--html')
-    elif show_uncovered:
+    report_args = []
+    json_path = None
+    if show_uncovered:
         # Show uncovered lines
-        cmd.append('--show-missing-lines')
-    elif not show_files:
-        # Only use summary-only if we don't need per-file details
-        cmd.append('--summary-only')
-
-    # Add test filter if specified
+        report_args.append('--show-missing-lines')
+    else:
+        # The JSON summary has totals and per-file coverage (uncovered line
+        # lists only exist in the text report); write it to a file so test
+        # output on stdout can't get mixed into it
+        import tempfile
+        fd, json_path = tempfile.mkstemp(prefix='multi-llm-cov-', suffix='.json')
+        os.close(fd)
+        report_args.extend(['--json', '--summary-only', '--output-path', json_path])
+    cmd.extend(report_args)
+
+    # Add test filter and thread count if specified; tests otherwise run
+    # with libtest's default parallelism
+    test_args = []
     if test_filter:
-        cmd.extend(['--', test_filter])
-    elif include_integration:
-        # For integration tests, serialize execution to avoid rate limits
-        cmd.extend(['--', '--test-threads=1'])
+        test_args.append(test_filter)
+    if test_threads:
+        test_args.append(f'--test-threads={test_threads}')
+    if test_args:
+        cmd.extend(['--'] + test_args)
+
+    stamp = None
+    if not report_only and not parallel_binaries:
+        stamp = coverage_run_stamp(crate_path, include_integration, test_args)
+        report_only = not rerun_tests and can_reuse_last_run(crate_path, stamp)
 
     print(f"Running coverage analysis for {crate_path.name}...")
     if include_integration:
@@ -198,45 +670,77 @@ def run_coverage(crate_path: Path, test_filter: Optional[str], html: bool, show_
         print("  Test types: unit only")
     if test_filter:
         print(f"  Test filter: {test_filter}")
+    if test_threads:
+        print(f"  Test threads: {test_threads}")
+    if report_only:
+        print("  Tests: not rerun, reporting the last run's coverage data")
+    elif parallel_binaries:
+        print("  Test binaries: run in parallel")
     print()
 
     try:
         # Set environment for integration tests
         test_env = os.environ.copy()
+        # One profile per binary (%m merges concurrent runs of the same
+        # binary) instead of one per process, so there is far less to merge
+        test_env.setdefault('LLVM_PROFILE_FILE_NAME', 'multi-llm-%m.profraw')
 
-        # Run from the crate directory itself
-        result = subprocess.run(
-            cmd,
-            cwd=crate_path,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            env=test_env
-        )
+        if report_only:
+            cmd = ['cargo', 'llvm-cov', 'report'] + report_args
+        else:
+            # The profile data is about to be replaced
+            write_last_run_stamp(crate_path, None)
 
-        # Check if stderr contains actual errors (not just warnings)
-        # cargo-llvm-cov may output warnings to stderr even on success
-        if result.returncode != 0:
-            # Only fail if returncode is non-zero AND we have actual error output
-            stderr_lower = result.stderr.lower()
-            has_fatal_error = any(marker in stderr_lower for marker in [
-                'error: could not compile',
-                'error: failed to',
-                'error: no such',
-                'could not compile',
-            ])
-
-            if has_fatal_error:
-                print("Error running coverage analysis:", file=sys.stderr)
-                print(result.stderr, file=sys.stderr)
+        if parallel_binaries and not report_only:
+            test_env = run_binaries_in_parallel(crate_path, include_integration, test_args, timeout, test_env, reuse_profiles)
+            if test_env is None:
+                return None
+            # Merge the profiles the binaries wrote into one report
+            cmd = ['cargo', 'llvm-cov', 'report'] + report_args
+
+        if json_path:
+            # Run from the crate directory itself
+            result = subprocess.run(
+                cmd,
+                cwd=crate_path,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                env=test_env
+            )
+            if not check_cargo_result(result):
+                return None
+            output = read_json_report(json_path)
+            if output is None:
+                return None
+            # Per-file rows are only shown with --show-files or a test filter
+            coverage, files = parse_json_report(output, show_files or bool(test_filter))
+            report = coverage, files, None
+        else:
+            # Parse the text report as it streams in; warnings in stderr don't
+            # discard it
+            result, report = stream_text_report(cmd, crate_path, test_env, timeout, show_uncovered)
+            if not check_cargo_result(result):
                 return None
-            # If returncode is non-zero but no fatal errors, treat as warning
-            elif result.stderr:
-                print("Warning from cargo-llvm-cov:", file=sys.stderr)
-                print(result.stderr, file=sys.stderr)
 
-        # Return stdout even if there were warnings in stderr
-        return result.stdout
+        if stamp and not report_only and result.returncode == 0:
+            write_last_run_stamp(crate_path, stamp)
+
+        if html:
+            # Render HTML from the profile data the run above left behind,
+            # so the tests still run once and the summary stays parseable
+            html_result = subprocess.run(
+                ['cargo', 'llvm-cov', 'report', '--html'],
+                cwd=crate_path,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                env=test_env
+            )
+            if not check_cargo_result(html_result):
+                return None
+
+        return report
 
     except subprocess.TimeoutExpired:
         print(f"Error: Coverage analysis timed out after {timeout} seconds", file=sys.stderr)
@@ -244,6 +748,9 @@ def run_coverage(crate_path: Path, test_filter: Optional[str], html: bool, show_
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return None
+    finally:
+        if json_path and os.path.exists(json_path):
+            os.unlink(json_path)
 
 
 def print_coverage_report(coverage: Dict[str, float], goal: float, minimum: float, test_filter: Optional[str], filtered_cov: Optional[float] = None, crate_name: Optional[str] = None):
@@ -368,58 +875,71 @@ def format_filename_with_prefix(filename: str, strip_prefix: Optional[str]) -> s
     return filename
 
 
-def format_uncovered_lines(line_numbers: List[int], max_display: int = None) -> str:
-    """Format uncovered line numbers into a compact string.
+def format_uncovered_lines(line_ranges: List[Tuple[int, int]], max_display: int = None) -> str:
+    """Format uncovered line ranges into a compact string.
 
-    Converts consecutive lines into ranges (e.g., [1,2,3,5,6] -> "1-3, 5-6")
+    Merges overlapping and adjacent ranges (e.g., [(1,2),(3,3),(5,6)] -> "1-3, 5-6")
     Optionally truncates if there are too many lines.
     """
-    if not line_numbers:
+    if not line_ranges:
         return ""
 
-    sorted_lines = sorted(line_numbers)
-    ranges = []
-    start = sorted_lines[0]
-    end = sorted_lines[0]
-
-    for num in sorted_lines[1:]:
-        if num == end + 1:
-            end = num
+    merged = []
+    for start, end in sorted(line_ranges):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
         else:
-            if start == end:
-                ranges.append(str(start))
-            else:
-                ranges.append(f"{start}-{end}")
-            start = num
-            end = num
-
-    # Add the last range
-    if start == end:
-        ranges.append(str(start))
-    else:
-        ranges.append(f"{start}-{end}")
+            merged.append([start, end])
 
-    result = ", ".join(ranges)
+    result = ", ".join(str(start) if start == end else f"{start}-{end}" for start, end in merged)
     if max_display and len(result) > max_display:
-        return result[:max_display] + f"... ({len(sorted_lines)} total lines)"
+        total = sum(end - start + 1 for start, end in merged)
+        return result[:max_display] + f"... ({total} total lines)"
     return result
 
 
-def find_uncovered_for_file(filepath: str, uncovered_map: Dict[str, List[int]]) -> Optional[List[int]]:
-    """Find uncovered lines for a file, matching by suffix if exact match fails."""
-    # Try exact match first
-    if filepath in uncovered_map:
-        return uncovered_map[filepath]
+def build_uncovered_index(uncovered_map: Dict[str, List[Tuple[int, int]]]) -> Dict[str, List[Tuple[int, int]]]:
+    """Index uncovered lines by every trailing part of each file's path.
 
-    # Try matching by suffix (file path without full absolute path)
+    The per-file table shows paths relative to the source root while the
+    uncovered section lists absolute paths, so '/abs/src/a/b.rs' is indexed
+    under 'b.rs', 'a/b.rs', 'src/a/b.rs', ... and the full path. Where tails
+    collide, the first file listed wins.
+    """
+    index = {}
     for uncov_path, lines in uncovered_map.items():
-        if uncov_path.endswith(filepath) or filepath in uncov_path:
-            return lines
+        parts = uncov_path.split('/')
+        for i in range(len(parts)):
+            index.setdefault('/'.join(parts[i:]), lines)
+    return index
 
-    return None
+
+def find_uncovered_for_file(filepath: str, uncovered_index: Dict[str, List[Tuple[int, int]]]) -> Optional[List[Tuple[int, int]]]:
+    """Find uncovered lines for a file by exact path or path suffix."""
+    return uncovered_index.get(filepath)
 
 
-def print_file_coverage(files: Dict[str, Dict[str, float]], show_all: bool, module_filter: Optional[str] = None, crate_name: Optional[str] = None, uncovered_lines: Optional[Dict[str, List[int]]] = None):
+def print_file_rows(files: Dict[str, Dict[str, float]], strip_prefix: Optional[str], uncovered_index: Optional[Dict[str, List[Tuple[int, int]]]]):
+    """Print one coverage row per file, sorted by name, with uncovered lines if available."""
+    # Build the rows first and write them in one call instead of a print per line
+    out = []
+    for filename, cov in sorted(files.items()):
+        line_cov = cov['line']
+        status = "✅" if line_cov >= 90 else "⚠️ " if line_cov >= 80 else "❌"
+        display_name = format_filename_with_prefix(filename, strip_prefix)
+        out.append(f"  {status} {display_name:50s} {line_cov:6.2f}%\n")
+
+        # Show uncovered lines if available
+        if uncovered_index:
+            uncov = find_uncovered_for_file(filename, uncovered_index)
+            if uncov:
+                formatted_lines = format_uncovered_lines(uncov)
+                out.append(f"       Uncovered: {formatted_lines}\n")
+    sys.stdout.write(''.join(out))
+
+
+def print_file_coverage(files: Dict[str, Dict[str, float]], show_all: bool, module_filter: Optional[str] = None, crate_name: Optional[str] = None, uncovered_lines: Optional[Dict[str, List[Tuple[int, int]]]] = None):
     """Print per-file coverage details.
 
     Args:
@@ -427,8 +947,11 @@ def print_file_coverage(files: Dict[str, Dict[str, float]], show_all: bool, modu
         show_all: If True, show all files; if False, filter to crate_name
         module_filter: Optional module prefix to filter by (e.g., 'billing/')
         crate_name: Name of the crate being analyzed (e.g., 'multi-llm')
-        uncovered_lines: Optional dict mapping file paths to uncovered line numbers
+        uncovered_lines: Optional dict mapping file paths to uncovered line ranges
     """
+    # Match table rows to uncovered entries by path suffix in O(1)
+    uncovered_index = build_uncovered_index(uncovered_lines) if uncovered_lines else None
+
     print("\nPer-File Coverage:")
     print("-" * 60)
 
@@ -453,18 +976,7 @@ def print_file_coverage(files: Dict[str, Dict[str, float]], show_all: bool, modu
         if module_files:
             module_name = module_filter.rstrip('/').capitalize()
             print(f"\n{module_name} Files:")
-            for filename, cov in sorted(module_files.items()):
-                line_cov = cov['line']
-                status = "✅" if line_cov >= 90 else "⚠️ " if line_cov >= 80 else "❌"
-                display_name = format_filename_with_prefix(filename, strip_prefix)
-                print(f"  {status} {display_name:50s} {line_cov:6.2f}%")
-
-                # Show uncovered lines if available
-                if uncovered_lines:
-                    uncov = find_uncovered_for_file(filename, uncovered_lines)
-                    if uncov:
-                        formatted_lines = format_uncovered_lines(uncov)
-                        print(f"       Uncovered: {formatted_lines}")
+            print_file_rows(module_files, strip_prefix, uncovered_index)
 
             # Calculate average
             avg = calculate_average_coverage(files, module_filter)
@@ -474,49 +986,25 @@ def print_file_coverage(files: Dict[str, Dict[str, float]], show_all: bool, modu
             print(f"\n  No files found matching '{module_filter}'")
 
     if show_all or not module_filter:
-        # Show all files grouped by module
-        shown_files = set()
-
-        # Common module patterns
-        common_modules = ['billing/', 'domain/', 'executor/', 'llm/', 'storage/', 'tools/', 'agents/']
-
-        for prefix in common_modules:
-            module_files = {k: v for k, v in files.items() if prefix in k and k not in shown_files}
-
+        # Show all files grouped by module, each under the first module
+        # pattern it matches; sort into groups in a single pass. Names may
+        # still carry a crate/src/ prefix, so match anywhere in the path
+        groups = {prefix: {} for prefix in COMMON_MODULES}
+        other_files = {}
+        for filename, cov in files.items():
+            prefix = next((p for p in COMMON_MODULES if p in filename), None)
+            (groups[prefix] if prefix else other_files)[filename] = cov
+
+        for prefix, module_files in groups.items():
             if module_files:
                 module_name = prefix.rstrip('/').capitalize()
                 print(f"\n{module_name} Files:")
-                for filename, cov in sorted(module_files.items()):
-                    line_cov = cov['line']
-                    status = "✅" if line_cov >= 90 else "⚠️ " if line_cov >= 80 else "❌"
-                    display_name = format_filename_with_prefix(filename, strip_prefix)
-                    print(f"  {status} {display_name:50s} {line_cov:6.2f}%")
-
-                    # Show uncovered lines if available
-                    if uncovered_lines:
-                        uncov = find_uncovered_for_file(filename, uncovered_lines)
-                        if uncov:
-                            formatted_lines = format_uncovered_lines(uncov)
-                            print(f"       Uncovered: {formatted_lines}")
-
-                    shown_files.add(filename)
+                print_file_rows(module_files, strip_prefix, uncovered_index)
 
         # Show any remaining uncategorized files
-        other_files = {k: v for k, v in files.items() if k not in shown_files}
         if other_files:
             print("\nOther Files:")
-            for filename, cov in sorted(other_files.items()):
-                line_cov = cov['line']
-                status = "✅" if line_cov >= 90 else "⚠️ " if line_cov >= 80 else "❌"
-                display_name = format_filename_with_prefix(filename, strip_prefix)
-                print(f"  {status} {display_name:50s} {line_cov:6.2f}%")
-
-                # Show uncovered lines if available
-                if uncovered_lines:
-                    uncov = find_uncovered_for_file(filename, uncovered_lines)
-                    if uncov:
-                        formatted_lines = format_uncovered_lines(uncov)
-                        print(f"       Uncovered: {formatted_lines}")
+            print_file_rows(other_files, strip_prefix, uncovered_index)
 
     print("-" * 60)
 
@@ -538,34 +1026,20 @@ def main():
     show_uncovered = args.show_uncovered
     # Auto-enable show_files when show_uncovered is requested
     show_files = args.show_files or show_uncovered
-    output = run_coverage(crate_path, args.test_filter, args.html, show_files, args.include_integration, show_uncovered, args.timeout)
+    report = run_coverage(crate_path, args.test_filter, args.html, show_files, args.include_integration, show_uncovered, args.timeout, args.test_threads,
+                          args.parallel_binaries or args.reuse_profiles, args.reuse_profiles,
+                          args.report_only, args.rerun_tests)
 
-    if output is None:
+    if report is None:
         return 3
 
-    lines = output.splitlines()
-
-    # Parse overall coverage
-    coverage = None
-    for line in lines:
-        coverage = parse_coverage_line(line)
-        if coverage:
-            break
+    coverage, files, uncovered = report
 
     if coverage is None:
         print("Error: Failed to parse coverage data", file=sys.stderr)
-        print("\nOutput from coverage tool:")
-        print(output)
+        print("Run cargo llvm-cov in the crate directory to see the tool's output.", file=sys.stderr)
         return 3
 
-    # Parse per-file coverage
-    files = parse_file_coverage(lines)
-
-    # Parse uncovered lines if show_uncovered was requested
-    uncovered = None
-    if show_uncovered:
-        uncovered = parse_uncovered_lines(lines)
-
     # Calculate filtered coverage if test filter is specified
     filtered_cov = None
     module_filter = None
@@ -669,6 +1143,37 @@ Examples:
         help='Include integration tests (tests/) in coverage analysis'
     )
 
+    parser.add_argument(
+        '--test-threads',
+        type=int,
+        default=None,
+        help='Number of test threads (default: one per CPU; use 1 to serialize tests)'
+    )
+
+    parser.add_argument(
+        '--parallel-binaries',
+        action='store_true',
+        help='Run each test binary in its own process concurrently, then merge coverage'
+    )
+
+    parser.add_argument(
+        '--reuse-profiles',
+        action='store_true',
+        help='With --parallel-binaries (implied), reuse cached coverage of test binaries unchanged since a passing run'
+    )
+
+    parser.add_argument(
+        '--report-only',
+        action='store_true',
+        help="Don't run tests; report the coverage data left by the last run"
+    )
+
+    parser.add_argument(
+        '--rerun-tests',
+        action='store_true',
+        help="Always run the tests, even if the last run's coverage data is still current"
+    )
+
     parser.add_argument(
         '--timeout',
         type=int,
@@ -18,7 +18,7 @@ Checks:
 - Trait compliance test naming patterns
 
 Usage:
-    python3 scripts/verify-test-naming.py <crate-path>
+    python3 scripts/verify-test-naming.py <crate-path> [--jobs N] [--no-cache] [--only-changed REF]
 
 Example:
     python3 scripts/verify-test-naming.py multi-llm
@@ -36,64 +36,70 @@ import re
 import argparse
 from pathlib import Path
 
+from verify_all import add_scan_arguments, changed_files
+from verify_common import enable_cache, find_test_files, map_files
 
-def find_test_files(crate_path):
-    """Find all test files in the crate."""
-    test_files = []
-    src_path = Path(crate_path) / 'src'
 
-    if not src_path.exists():
-        print(f"Error: {src_path} does not exist", file=sys.stderr)
-        return None
+# Function definitions: fn name(...) or pub fn name(...), optionally generic.
+# Each alternative starts with a literal, so the regex engine can skip ahead
+# to a possible start instead of trying the optional prefixes everywhere.
+FN_DEF = re.compile(r'(?:pub\s+async\s+fn|pub\s+fn|async\s+fn|fn)\s+(\w+)\s*(?:<[^>]+>)?\s*\(')
 
-    # Find all .rs files in tests/ subdirectories
-    for test_file in src_path.rglob('tests/**/*.rs'):
-        if test_file.name != 'mod.rs':
-            test_files.append(test_file)
+# The inline test module: mod tests {
+MOD_TESTS = re.compile(r'mod\s+tests\s*\{')
 
-    # Also check files with #[cfg(test)]
-    for rs_file in src_path.rglob('*.rs'):
-        if '/tests/' not in str(rs_file):
-            with open(rs_file, 'r') as f:
-                if '#[cfg(test)]' in f.read():
-                    test_files.append(rs_file)
+# Trait implementations: impl Trait for Type
+TRAIT_IMPL = re.compile(r'impl\s+(\w+)\s+for\s+(\w+)')
 
-    return test_files
+# Recognized helper function prefixes
+VALID_HELPER_PREFIXES = (
+    'helper_',           # Generic helper functions
+    'create_concrete_',  # Factory for units under test
+    'create_mock_',      # Factory for mock dependencies
+    'setup_',            # Test setup helpers
+    'teardown_',         # Test cleanup helpers
+    'assert_',           # Custom assertion helpers
+    'verify_',           # Verification helpers
+    'build_',            # Builder pattern helpers
+    'make_',             # Alternative factory pattern
+)
 
+# Words that suggest a helper is really a test missing its test_ prefix
+TEST_KEYWORDS = ('should', 'when', 'verifies', 'validates', 'checks', 'example', 'caller')
 
-def extract_function_names(file_path):
-    """Extract function names from a file."""
-    with open(file_path, 'r') as f:
-        content = f.read()
 
+def extract_function_names(content):
+    """Extract function names from a file's content."""
     functions = {
         'test_functions': [],
         'helper_functions': [],
-        'all_functions': []
     }
 
-    # Find all function definitions
-    # Pattern matches: fn name(...) or pub fn name(...)
-    pattern = r'(?:pub\s+)?(?:async\s+)?fn\s+(\w+)\s*(?:<[^>]+>)?\s*\('
-
-    for match in re.finditer(pattern, content):
+    # Find all function definitions; matches come in order, so line numbers
+    # are counted on from the previous match
+    line_num = 1
+    counted_to = 0
+    for match in FN_DEF.finditer(content):
         func_name = match.group(1)
-        line_num = content[:match.start()].count('\n') + 1
+        line_num += content.count('\n', counted_to, match.start())
+        counted_to = match.start()
 
         # Check if it's preceded by #[test] or #[tokio::test]
         # Look at the immediate preceding lines (not too far back to avoid nested functions)
-        lines_before = content[:match.start()].split('\n')
+        window_start = match.start()
+        for _ in range(10):
+            window_start = content.rfind('\n', 0, window_start)
+            if window_start == -1:
+                break
+        lines_before = content[window_start + 1:match.start()].split('\n')
 
         # Check last few lines for test attribute, but ignore if this is a nested function
         is_test = False
         is_nested = False
 
         # Look back up to 10 lines
-        for i in range(min(10, len(lines_before))):
-            line_idx = len(lines_before) - 1 - i
-            if line_idx < 0:
-                break
-            line = lines_before[line_idx].strip()
+        for line in reversed(lines_before):
+            line = line.strip()
 
             # Found a test attribute
             if line.startswith('#[test]') or line.startswith('#[tokio::test]'):
@@ -114,8 +120,6 @@ def extract_function_names(file_path):
         else:
             functions['helper_functions'].append((func_name, line_num))
 
-        functions['all_functions'].append((func_name, line_num, is_test))
-
     return functions
 
 
@@ -138,19 +142,7 @@ def check_test_function_naming(test_functions):
 
 def is_valid_helper_name(func_name):
     """Check if a function name follows valid helper naming patterns."""
-    valid_prefixes = [
-        'helper_',           # Generic helper functions
-        'create_concrete_',  # Factory for units under test
-        'create_mock_',      # Factory for mock dependencies
-        'setup_',            # Test setup helpers
-        'teardown_',         # Test cleanup helpers
-        'assert_',           # Custom assertion helpers
-        'verify_',           # Verification helpers
-        'build_',            # Builder pattern helpers
-        'make_',             # Alternative factory pattern
-    ]
-
-    return any(func_name.startswith(prefix) for prefix in valid_prefixes)
+    return func_name.startswith(VALID_HELPER_PREFIXES)
 
 
 def check_helper_function_naming(helper_functions):
@@ -174,8 +166,8 @@ def check_helper_function_naming(helper_functions):
         else:
             # Helper function doesn't follow any recognized pattern - might be a test missing test_ prefix
             # But only flag if it looks like a test (common test keywords)
-            test_keywords = ['should', 'when', 'verifies', 'validates', 'checks', 'example', 'caller']
-            if any(keyword in func_name.lower() for keyword in test_keywords):
+            lowered = func_name.lower()
+            if any(keyword in lowered for keyword in TEST_KEYWORDS):
                 suggestions.append({
                     'line': line_num,
                     'function': func_name,
@@ -186,21 +178,18 @@ def check_helper_function_naming(helper_functions):
     return issues, suggestions
 
 
-def check_module_structure(file_path):
+def check_module_structure(file_path, content):
     """Check if file has proper #[cfg(test)] module structure."""
-    with open(file_path, 'r') as f:
-        content = f.read()
-
     issues = []
 
-    # Check for #[cfg(test)]
-    has_cfg_test = '#[cfg(test)]' in content
-
-    # Check for mod tests
-    has_mod_tests = re.search(r'mod\s+tests\s*\{', content) is not None
-
     # If file has tests, it should have proper structure
     if '#[test]' in content or '#[tokio::test]' in content:
+        # Check for #[cfg(test)]
+        has_cfg_test = '#[cfg(test)]' in content
+
+        # Check for mod tests
+        has_mod_tests = MOD_TESTS.search(content) is not None
+
         if '/tests/' not in str(file_path):
             # Inline tests should have #[cfg(test)] mod tests
             if not has_cfg_test:
@@ -217,19 +206,20 @@ def check_module_structure(file_path):
     return issues
 
 
-def check_trait_compliance_tests(file_path):
+def check_trait_compliance_tests(content):
     """Check for trait compliance test patterns."""
-    with open(file_path, 'r') as f:
-        content = f.read()
-
     suggestions = []
 
+    # Without an impl there is nothing to scan for, and with a
+    # trait_compliance_tests module there is nothing to suggest
+    if 'impl' not in content or 'trait_compliance_tests' in content:
+        return suggestions
+
     # Look for traits that might need compliance tests
     # Check if file has multiple implementations of same trait
-    trait_impl_pattern = r'impl\s+(\w+)\s+for\s+(\w+)'
     trait_impls = {}
 
-    for match in re.finditer(trait_impl_pattern, content):
+    for match in TRAIT_IMPL.finditer(content):
         trait_name = match.group(1)
         impl_name = match.group(2)
 
@@ -237,21 +227,79 @@ def check_trait_compliance_tests(file_path):
             trait_impls[trait_name] = []
         trait_impls[trait_name].append(impl_name)
 
-    # Check if compliance tests exist for multi-implementation traits
+    # Suggest compliance tests for multi-implementation traits
     for trait_name, impl_names in trait_impls.items():
         if len(impl_names) > 1:
-            # Look for trait_compliance_tests module
-            if 'trait_compliance_tests' not in content:
-                suggestions.append({
-                    'trait': trait_name,
-                    'implementations': impl_names,
-                    'issue': f'Multiple implementations of {trait_name} found but no trait_compliance_tests module',
-                    'severity': 'info'
-                })
+            suggestions.append({
+                'trait': trait_name,
+                'implementations': impl_names,
+                'issue': f'Multiple implementations of {trait_name} found but no trait_compliance_tests module',
+                'severity': 'info'
+            })
 
     return suggestions
 
 
+def analyze_file(task):
+    """Run every naming check on one file; task is (path, rel_path, content).
+
+    Returns (violations, warnings, suggestions). Runs in a worker process
+    when files are checked in parallel.
+    """
+    test_file, rel_path, content = task
+    violations = []
+    warnings = []
+    suggestions = []
+
+    # Extract functions
+    functions = extract_function_names(content)
+
+    # Check test function naming
+    test_naming_issues = check_test_function_naming(functions['test_functions'])
+    for issue in test_naming_issues:
+        violations.append({
+            'file': rel_path,
+            **issue
+        })
+
+    # Check helper function naming
+    helper_issues, helper_suggestions = check_helper_function_naming(functions['helper_functions'])
+    for issue in helper_issues:
+        violations.append({
+            'file': rel_path,
+            **issue
+        })
+    for suggestion in helper_suggestions:
+        warnings.append({
+            'file': rel_path,
+            **suggestion
+        })
+
+    # Check module structure
+    module_issues = check_module_structure(test_file, content)
+    for issue in module_issues:
+        if issue['severity'] == 'violation':
+            violations.append({
+                'file': rel_path,
+                **issue
+            })
+        else:
+            warnings.append({
+                'file': rel_path,
+                **issue
+            })
+
+    # Check trait compliance
+    trait_suggestions = check_trait_compliance_tests(content)
+    for suggestion in trait_suggestions:
+        suggestions.append({
+            'file': rel_path,
+            **suggestion
+        })
+
+    return violations, warnings, suggestions
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Verify unit test naming follows multi-llm conventions'
@@ -260,15 +308,23 @@ def main():
         'crate_path',
         help='Path to the crate to check (e.g., multi-llm)'
     )
+    add_scan_arguments(parser)
 
     args = parser.parse_args()
 
-    test_files = find_test_files(args.crate_path)
+    changed = None
+    if args.only_changed is not None:
+        changed = changed_files(args.crate_path, args.only_changed)
+        if changed is None:
+            return 2
+
+    test_files = find_test_files(args.crate_path, changed)
 
     if test_files is None:
         return 2
 
-    if not test_files:
+    # With --only-changed, having no changed test files is not a problem
+    if not test_files and changed is None:
         print("⚠️  No test files found")
         return 1
 
@@ -278,54 +334,17 @@ def main():
 
     print(f"Checking naming conventions in {len(test_files)} test file(s)...\n")
 
-    for test_file in test_files:
-        rel_path = test_file.relative_to(Path(args.crate_path) / 'src')
-
-        # Extract functions
-        functions = extract_function_names(test_file)
-
-        # Check test function naming
-        test_naming_issues = check_test_function_naming(functions['test_functions'])
-        for issue in test_naming_issues:
-            all_violations.append({
-                'file': str(rel_path),
-                **issue
-            })
-
-        # Check helper function naming
-        helper_issues, helper_suggestions = check_helper_function_naming(functions['helper_functions'])
-        for issue in helper_issues:
-            all_violations.append({
-                'file': str(rel_path),
-                **issue
-            })
-        for suggestion in helper_suggestions:
-            all_warnings.append({
-                'file': str(rel_path),
-                **suggestion
-            })
-
-        # Check module structure
-        module_issues = check_module_structure(test_file)
-        for issue in module_issues:
-            if issue['severity'] == 'violation':
-                all_violations.append({
-                    'file': str(rel_path),
-                    **issue
-                })
-            else:
-                all_warnings.append({
-                    'file': str(rel_path),
-                    **issue
-                })
-
-        # Check trait compliance
-        trait_suggestions = check_trait_compliance_tests(test_file)
-        for suggestion in trait_suggestions:
-            all_suggestions.append({
-                'file': str(rel_path),
-                **suggestion
-            })
+    # Check the files, in parallel when there are enough of them; results
+    # for unchanged files come from the cache
+    src_path = Path(args.crate_path) / 'src'
+    tasks = [(test_file, str(test_file.relative_to(src_path)), content) for test_file, content in test_files]
+    cache = None if args.no_cache else enable_cache(args.crate_path, 'test-naming')
+    results = map_files(analyze_file, tasks, args.jobs, cache)
+
+    for violations, warnings, suggestions in results:
+        all_violations.extend(violations)
+        all_warnings.extend(warnings)
+        all_suggestions.extend(suggestions)
 
     # Report results
     exit_code = 0
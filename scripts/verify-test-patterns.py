@@ -10,7 +10,7 @@ Checks:
 - TODO implementation tests exist
 
 Usage:
-    python3 scripts/verify-test-patterns.py <crate-path> [--strict]
+    python3 scripts/verify-test-patterns.py <crate-path> [--strict] [--jobs N] [--no-cache] [--only-changed REF]
 
 Example:
     python3 scripts/verify-test-patterns.py multi-llm
@@ -28,45 +28,42 @@ import re
 import argparse
 from pathlib import Path
 
+from verify_all import add_scan_arguments, changed_files
+from verify_common import enable_cache, find_test_files, map_files
 
-def find_test_files(crate_path):
-    """Find all test files in the crate."""
-    test_files = []
-    src_path = Path(crate_path) / 'src'
 
-    if not src_path.exists():
-        print(f"Error: {src_path} does not exist", file=sys.stderr)
-        return None
+# Required unit documentation; both "UNIT UNDER TEST:" and "UNITS UNDER TEST:" count
+UNIT_UNDER_TEST = re.compile(r'UNITS? UNDER TEST:')
+BUSINESS_RESPONSIBILITY = re.compile(r'BUSINESS RESPONSIBILITY:')
+TEST_COVERAGE = re.compile(r'TEST COVERAGE:')
 
-    # Find all .rs files in tests/ subdirectories
-    for test_file in src_path.rglob('tests/**/*.rs'):
-        if test_file.name != 'mod.rs':
-            test_files.append(test_file)
+# Start of a function definition on a stripped line
+FN_START = re.compile(r'(pub\s+)?fn\s+\w+')
 
-    # Also check files with #[cfg(test)]
-    for rs_file in src_path.rglob('*.rs'):
-        if '/tests/' not in str(rs_file):
-            with open(rs_file, 'r') as f:
-                if '#[cfg(test)]' in f.read():
-                    test_files.append(rs_file)
+# Test functions: #[test] or #[tokio::test] followed by fn name
+TEST_FN = re.compile(r'#\[(tokio::)?test\]\s*(?:async\s+)?fn\s+(\w+)')
 
-    return test_files
+# Braces, for matching a function body's closing brace
+BRACE = re.compile(r'[{}]')
 
+# Trait definitions and implementations
+TRAIT_DEF = re.compile(r'pub\s+trait\s+(\w+)')
+TRAIT_IMPL = re.compile(r'impl\s+\w+\s+for\s+(\w+)')
+
+# TODO comments: // TODO: ... or // TODO(...)
+TODO_COMMENT = re.compile(r'//\s*TODO[:\(]([^\\n]+)')
 
-def check_unit_documentation(file_path):
-    """Check if file has required unit documentation."""
-    with open(file_path, 'r') as f:
-        content = f.read()
 
+def check_unit_documentation(content):
+    """Check if file has required unit documentation."""
     # Only check files that actually have tests
     if not ('#[test]' in content or '#[tokio::test]' in content):
         return {'has_tests': False}
 
     # Look for required documentation sections
-    # Accept both singular "UNIT UNDER TEST:" and plural "UNITS UNDER TEST:"
-    has_unit_under_test = bool(re.search(r'UNITS? UNDER TEST:', content))
-    has_business_responsibility = bool(re.search(r'BUSINESS RESPONSIBILITY:', content))
-    has_test_coverage = bool(re.search(r'TEST COVERAGE:', content))
+    has_unit_under_test = bool(UNIT_UNDER_TEST.search(content))
+    has_business_responsibility = bool(BUSINESS_RESPONSIBILITY.search(content))
+    has_test_coverage = bool(TEST_COVERAGE.search(content))
 
     missing = []
     if not has_unit_under_test:
@@ -83,10 +80,9 @@ def check_unit_documentation(file_path):
     }
 
 
-def check_import_patterns(file_path):
+def check_import_patterns(content):
     """Check if imports follow proper patterns."""
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
+    lines = content.split('\n')
 
     issues = []
 
@@ -98,7 +94,7 @@ def check_import_patterns(file_path):
         stripped = line.strip()
 
         # Track if we're inside a function
-        if re.match(r'(pub\s+)?fn\s+\w+', stripped):
+        if FN_START.match(stripped):
             in_function = True
             brace_count = 0
 
@@ -118,16 +114,16 @@ def check_import_patterns(file_path):
     return issues
 
 
-def check_aaa_pattern(file_path):
+def check_aaa_pattern(content):
     """Check if tests follow Arrange-Act-Assert pattern."""
-    with open(file_path, 'r') as f:
-        content = f.read()
-
     suggestions = []
 
+    # Files without a test attribute have nothing to match
+    if not ('#[test]' in content or '#[tokio::test]' in content):
+        return suggestions
+
     # Find all test functions
-    test_pattern = r'#\[(tokio::)?test\]\s*(?:async\s+)?fn\s+(\w+)'
-    test_matches = list(re.finditer(test_pattern, content))
+    test_matches = list(TEST_FN.finditer(content))
 
     for match in test_matches:
         func_name = match.group(2)
@@ -138,15 +134,15 @@ def check_aaa_pattern(file_path):
         if func_body_start == -1:
             continue
 
-        # Find matching closing brace (simplified)
+        # Find matching closing brace (simplified), jumping from brace to
+        # brace; an unclosed body runs to the end of the file
         brace_count = 1
-        pos = func_body_start + 1
-        while pos < len(content) and brace_count > 0:
-            if content[pos] == '{':
-                brace_count += 1
-            elif content[pos] == '}':
-                brace_count -= 1
-            pos += 1
+        pos = len(content)
+        for brace in BRACE.finditer(content, func_body_start + 1):
+            brace_count += 1 if brace.group() == '{' else -1
+            if brace_count == 0:
+                pos = brace.end()
+                break
 
         func_body = content[func_body_start:pos]
 
@@ -155,9 +151,10 @@ def check_aaa_pattern(file_path):
         has_act = '// Act' in func_body or '//Act' in func_body
         has_assert = '// Assert' in func_body or '//Assert' in func_body
 
-        # Only suggest AAA for longer tests (>10 lines)
-        if len(func_body.splitlines()) > 10 and not (has_arrange or has_act or has_assert):
-            line_num = content[:func_start].count('\n') + 1
+        # Only suggest AAA for longer tests (>10 lines); the body ends at its
+        # closing brace, so it spans one line more than it has newlines
+        if func_body.count('\n') >= 10 and not (has_arrange or has_act or has_assert):
+            line_num = content.count('\n', 0, func_start) + 1
             suggestions.append({
                 'line': line_num,
                 'function': func_name,
@@ -168,38 +165,35 @@ def check_aaa_pattern(file_path):
     return suggestions
 
 
-def check_trait_compliance(file_path):
+def check_trait_compliance(content):
     """Check for trait compliance tests when multiple implementations exist."""
-    with open(file_path, 'r') as f:
-        content = f.read()
-
     suggestions = []
 
-    # Look for trait definitions
-    trait_pattern = r'pub\s+trait\s+(\w+)'
-    traits = [m.group(1) for m in re.finditer(trait_pattern, content)]
+    # Most files define no traits, and files mentioning trait_compliance
+    # (which covers trait_compliance_tests) already have compliance tests;
+    # skip the regex scans for both
+    if 'trait' not in content or 'trait_compliance' in content:
+        return suggestions
 
-    if not traits:
+    # Look for a trait definition
+    if not TRAIT_DEF.search(content):
         return suggestions
 
     # Look for multiple implementations of same trait in crate
-    # This is a heuristic - we check if trait_compliance_tests module exists
-    if 'trait_compliance_tests' not in content and 'trait_compliance' not in content:
-        # Check if there are multiple impl blocks
-        impl_pattern = r'impl\s+\w+\s+for\s+(\w+)'
-        implementations = [m.group(1) for m in re.finditer(impl_pattern, content)]
+    # This is a heuristic - check if there are multiple impl blocks
+    implementations = [m.group(1) for m in TRAIT_IMPL.finditer(content)]
 
-        if len(implementations) > 1:
-            suggestions.append({
-                'issue': f'Multiple implementations found ({len(implementations)}) but no trait_compliance_tests module',
-                'severity': 'warning',
-                'details': 'Consider adding trait compliance tests for consistency'
-            })
+    if len(implementations) > 1:
+        suggestions.append({
+            'issue': f'Multiple implementations found ({len(implementations)}) but no trait_compliance_tests module',
+            'severity': 'warning',
+            'details': 'Consider adding trait compliance tests for consistency'
+        })
 
     return suggestions
 
 
-def check_todo_tests(file_path):
+def check_todo_tests(file_path, test_content):
     """Check if TODO comments in source have corresponding tests."""
     # Get the source file path (remove /tests/ from path)
     src_file = str(file_path).replace('/tests/', '/')
@@ -221,14 +215,10 @@ def check_todo_tests(file_path):
         with open(src_file, 'r') as f:
             src_content = f.read()
 
-        with open(file_path, 'r') as f:
-            test_content = f.read()
-
         suggestions = []
 
         # Find TODO comments in source
-        todo_pattern = r'//\s*TODO[:\(]([^\\n]+)'
-        todos = list(re.finditer(todo_pattern, src_content))
+        todos = list(TODO_COMMENT.finditer(src_content))
 
         if todos:
             # Check if test file mentions TODO testing
@@ -246,6 +236,61 @@ def check_todo_tests(file_path):
     return []
 
 
+def analyze_file(task):
+    """Run every pattern check on one file; task is (path, rel_path, content).
+
+    Returns (violations, warnings, suggestions). Runs in a worker process
+    when files are checked in parallel, and results are cached by the file's
+    stat, so the TODO check (which also reads the source file) is left out.
+    """
+    _, rel_path, content = task
+    violations = []
+    warnings = []
+    suggestions = []
+
+    # Check unit documentation
+    doc_check = check_unit_documentation(content)
+    if doc_check['has_tests'] and not doc_check['has_documentation']:
+        violations.append({
+            'file': rel_path,
+            'issue': f"Missing required documentation: {', '.join(doc_check['missing'])}",
+            'severity': 'violation'
+        })
+
+    # Check import patterns
+    import_issues = check_import_patterns(content)
+    for issue in import_issues:
+        if issue['severity'] == 'violation':
+            violations.append({
+                'file': rel_path,
+                'line': issue['line'],
+                'issue': issue['issue']
+            })
+
+    # Check AAA pattern
+    aaa_suggestions = check_aaa_pattern(content)
+    suggestions.extend([{
+        'file': rel_path,
+        **s
+    } for s in aaa_suggestions])
+
+    # Check trait compliance
+    trait_suggestions = check_trait_compliance(content)
+    for suggestion in trait_suggestions:
+        if suggestion['severity'] == 'warning':
+            warnings.append({
+                'file': rel_path,
+                **suggestion
+            })
+        else:
+            suggestions.append({
+                'file': rel_path,
+                **suggestion
+            })
+
+    return violations, warnings, suggestions
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Verify unit tests follow multi-llm testing patterns'
@@ -259,15 +304,23 @@ def main():
         action='store_true',
         help='Treat warnings as violations'
     )
+    add_scan_arguments(parser)
 
     args = parser.parse_args()
 
-    test_files = find_test_files(args.crate_path)
+    changed = None
+    if args.only_changed is not None:
+        changed = changed_files(args.crate_path, args.only_changed)
+        if changed is None:
+            return 2
+
+    test_files = find_test_files(args.crate_path, changed)
 
     if test_files is None:
         return 2
 
-    if not test_files:
+    # With --only-changed, having no changed test files is not a problem
+    if not test_files and changed is None:
         print("⚠️  No test files found")
         return 1
 
@@ -277,53 +330,22 @@ def main():
 
     print(f"Checking test patterns in {len(test_files)} test file(s)...\n")
 
-    for test_file in test_files:
-        rel_path = test_file.relative_to(Path(args.crate_path) / 'src')
-
-        # Check unit documentation
-        doc_check = check_unit_documentation(test_file)
-        if doc_check['has_tests'] and not doc_check['has_documentation']:
-            all_violations.append({
-                'file': str(rel_path),
-                'issue': f"Missing required documentation: {', '.join(doc_check['missing'])}",
-                'severity': 'violation'
-            })
-
-        # Check import patterns
-        import_issues = check_import_patterns(test_file)
-        for issue in import_issues:
-            if issue['severity'] == 'violation':
-                all_violations.append({
-                    'file': str(rel_path),
-                    'line': issue['line'],
-                    'issue': issue['issue']
-                })
+    # Check the files, in parallel when there are enough of them; results
+    # for unchanged files come from the cache
+    src_path = Path(args.crate_path) / 'src'
+    tasks = [(test_file, str(test_file.relative_to(src_path)), content) for test_file, content in test_files]
+    cache = None if args.no_cache else enable_cache(args.crate_path, 'test-patterns')
+    results = map_files(analyze_file, tasks, args.jobs, cache)
 
-        # Check AAA pattern
-        aaa_suggestions = check_aaa_pattern(test_file)
-        all_suggestions.extend([{
-            'file': str(rel_path),
-            **s
-        } for s in aaa_suggestions])
-
-        # Check trait compliance
-        trait_suggestions = check_trait_compliance(test_file)
-        for suggestion in trait_suggestions:
-            if suggestion['severity'] == 'warning':
-                all_warnings.append({
-                    'file': str(rel_path),
-                    **suggestion
-                })
-            else:
-                all_suggestions.append({
-                    'file': str(rel_path),
-                    **suggestion
-                })
+    for (test_file, rel_path, content), (violations, warnings, suggestions) in zip(tasks, results):
+        all_violations.extend(violations)
+        all_warnings.extend(warnings)
+        all_suggestions.extend(suggestions)
 
         # Check TODO tests
-        todo_suggestions = check_todo_tests(test_file)
+        todo_suggestions = check_todo_tests(test_file, content)
         all_suggestions.extend([{
-            'file': str(rel_path),
+            'file': rel_path,
             **s
         } for s in todo_suggestions])
 
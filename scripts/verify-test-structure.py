@@ -9,7 +9,7 @@ Checks:
 - Test files mirror source file structure
 
 Usage:
-    python3 scripts/verify-test-structure.py <crate-path> [--max-lines LINES]
+    python3 scripts/verify-test-structure.py <crate-path> [--max-lines LINES] [--no-cache] [--fail-fast-docs]
 
 Example:
     python3 scripts/verify-test-structure.py multi-llm
@@ -27,128 +27,126 @@ import re
 import argparse
 from pathlib import Path
 
+from verify_common import CACHE_DIR, enable_cache, find_test_files, map_files
 
-def find_test_files(crate_path):
-    """Find all test files in the crate."""
-    test_files = []
-    src_path = Path(crate_path) / 'src'
 
-    if not src_path.exists():
-        print(f"Error: {src_path} does not exist", file=sys.stderr)
-        return None
+# Documentation headers every test file needs, as (marker, header name)
+DOC_HEADERS = (
+    ('UNIT UNDER TEST:', 'UNIT UNDER TEST'),
+    ('BUSINESS RESPONSIBILITY:', 'BUSINESS RESPONSIBILITY'),
+    ('TEST COVERAGE:', 'TEST COVERAGE'),
+)
 
-    # Find all .rs files in tests/ subdirectories
-    for test_file in src_path.rglob('tests/**/*.rs'):
-        test_files.append(test_file)
 
-    # Also check for inline #[cfg(test)] modules in large files
-    for rs_file in src_path.rglob('*.rs'):
-        if '/tests/' not in str(rs_file):
-            with open(rs_file, 'r') as f:
-                content = f.read()
-                if '#[cfg(test)]' in content:
-                    test_files.append(rs_file)
-
-    return test_files
-
-
-def check_file_size(test_file, max_lines):
+def check_file_size(content, max_lines):
     """Check if test file exceeds size limit."""
-    with open(test_file, 'r') as f:
-        line_count = sum(1 for _ in f)
+    # Count lines as iterating over the file would: a final line without a
+    # trailing newline still counts
+    line_count = content.count('\n')
+    if content and not content.endswith('\n'):
+        line_count += 1
 
     return line_count, line_count >= max_lines
 
 
-def check_documentation_header(test_file):
-    """Check if test file has required unit documentation."""
+def check_documentation_header(test_file, content, fail_fast=False):
+    """Check if test file has required unit documentation.
+
+    With fail_fast, scanning stops at the first missing header, which is
+    then the only one returned.
+    """
     # Skip documentation checks for mod.rs files (they're just module declarations)
     if test_file.name == 'mod.rs':
         return []
 
-    with open(test_file, 'r') as f:
-        content = f.read()
-
     # Look for required documentation patterns
-    has_unit_under_test = 'UNIT UNDER TEST:' in content
-    has_business_responsibility = 'BUSINESS RESPONSIBILITY:' in content
-    has_test_coverage = 'TEST COVERAGE:' in content
-
     missing = []
-    if not has_unit_under_test:
-        missing.append('UNIT UNDER TEST')
-    if not has_business_responsibility:
-        missing.append('BUSINESS RESPONSIBILITY')
-    if not has_test_coverage:
-        missing.append('TEST COVERAGE')
+    for marker, header in DOC_HEADERS:
+        if marker not in content:
+            missing.append(header)
+            if fail_fast:
+                break
 
     return missing
 
 
-def check_test_structure(test_file, crate_path):
-    """Check if test file is in proper location."""
-    rel_path = test_file.relative_to(Path(crate_path) / 'src')
+def check_test_structure(rel_path, has_cfg_test):
+    """Check if test file is in proper location.
 
+    has_cfg_test says whether the file contains #[cfg(test)], as already
+    found by find_test_files, so the file is not read again.
+    """
     # Check if it's in a tests/ subdirectory
-    is_in_tests_dir = 'tests' in rel_path.parts
+    is_in_tests_dir = 'tests' in rel_path.split(os.sep)
 
     # Check if it's inline (has #[cfg(test)] but not in tests/)
-    is_inline = False
-    if not is_in_tests_dir:
-        with open(test_file, 'r') as f:
-            if '#[cfg(test)]' in f.read():
-                is_inline = True
+    is_inline = not is_in_tests_dir and has_cfg_test
 
     return is_in_tests_dir, is_inline
 
 
-def check_mirrored_structure(crate_path, test_files):
-    """Check if test structure mirrors source structure."""
-    src_path = Path(crate_path) / 'src'
+def scan_source_file(task):
+    """Return (line count, has inline tests) for a source file."""
+    with open(task[0], 'r') as f:
+        content = f.read()
+    return len(content.splitlines()), '#[cfg(test)]' in content
+
+
+def check_mirrored_structure(crate_path, rs_files, inline_test_files, cache=None):
+    """Check if test structure mirrors source structure.
+
+    rs_files lists every .rs file under src/, as walked by find_test_files,
+    and inline_test_files the ones it found to contain #[cfg(test)]. With a
+    cache, untested source files whose stat is unchanged are not read again.
+    """
+    src_path = str(Path(crate_path) / 'src')
+    prefix_len = len(os.path.join(src_path, ''))
     issues = []
 
-    # Get all non-test .rs files
+    # Split the walk into non-test source files and the file names in each
+    # tests/ directory, so looking for a file's tests needs no filesystem calls
     source_files = []
-    for rs_file in src_path.rglob('*.rs'):
-        if '/tests/' not in str(rs_file) and rs_file.name != 'mod.rs':
-            rel_path = rs_file.relative_to(src_path)
+    tests_dir_names = {}
+    for path in rs_files:
+        rel_path = path[prefix_len:]
+        parts = rel_path.split(os.sep)
+        if 'tests' in parts[:-1]:
+            tests_dir_names.setdefault(os.path.dirname(path), set()).add(parts[-1])
+        elif parts[-1] != 'mod.rs':
             source_files.append(rel_path)
 
     # For each source file, check if there's a corresponding test
+    untested = []
     for source_rel in source_files:
         # Expected test location: replace parent dir with parent/tests/
-        parent = source_rel.parent
-        expected_test = parent / 'tests' / source_rel.name
+        parent, name = os.path.split(source_rel)
+        expected_test = os.path.join(parent, 'tests', name)
+        test_names = tests_dir_names.get(os.path.join(src_path, parent, 'tests'), ())
 
         # Check for standard pattern: tests/filename.rs
-        test_path = src_path / expected_test
-
-        # Also check for multi-file pattern: tests/filename_*.rs
-        stem = source_rel.stem
-        test_dir = src_path / parent / 'tests'
-        multi_file_tests = []
-        if test_dir.exists():
-            # Look for files matching filename_*.rs pattern
-            multi_file_tests = list(test_dir.glob(f'{stem}_*.rs'))
-
-        # Consider tests exist if either pattern found
-        has_tests = test_path.exists() or len(multi_file_tests) > 0
+        # Also check for multi-file pattern: tests/filename_*.rs (the index
+        # only holds .rs names, so the prefix alone decides)
+        multi_file_prefix = os.path.splitext(name)[0] + '_'
+        has_tests = name in test_names or any(
+            n.startswith(multi_file_prefix) for n in test_names
+        )
 
         if not has_tests:
-            # Check if it has inline tests
-            source_path = src_path / source_rel
-            with open(source_path, 'r') as f:
-                content = f.read()
-                line_count = len(content.splitlines())
-                has_inline_tests = '#[cfg(test)]' in content
-
-                # Only report if file is substantial (>100 lines) and has no tests
-                if line_count > 100 and not has_inline_tests:
-                    issues.append({
-                        'source': str(source_rel),
-                        'expected_test': str(expected_test),
-                        'lines': line_count
-                    })
+            # Check if it has inline tests; files already known to have
+            # them are never reported, so they need not be read again
+            source_path = os.path.join(src_path, source_rel)
+            if source_path not in inline_test_files:
+                untested.append((source_path, source_rel, expected_test))
+
+    scans = map_files(scan_source_file, untested, 1, cache)
+    for (_, source_rel, expected_test), (line_count, has_inline_tests) in zip(untested, scans):
+        # Only report if file is substantial (>100 lines) and has no tests
+        if line_count > 100 and not has_inline_tests:
+            issues.append({
+                'source': source_rel,
+                'expected_test': expected_test,
+                'lines': line_count
+            })
 
     return issues
 
@@ -167,14 +165,29 @@ def main():
         default=600,
         help='Maximum lines per test file (default: 600)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Do not read or write the per-file result cache in <crate>/{CACHE_DIR}'
+    )
+    parser.add_argument(
+        '--fail-fast-docs',
+        action='store_true',
+        help='Stop at the first missing documentation header in each file (warnings then name only that one)'
+    )
 
     args = parser.parse_args()
 
-    test_files = find_test_files(args.crate_path)
+    # mod.rs files under tests/ still count towards the size limit
+    rs_files = []
+    found = find_test_files(args.crate_path, keep_mod_rs=True, all_rs_files=rs_files)
 
-    if test_files is None:
+    if found is None:
         return 2
 
+    test_files = [test_file for test_file, _ in found]
+    inline_test_files = {str(test_file) for test_file, content in found if '#[cfg(test)]' in content}
+
     if not test_files:
         print("⚠️  No test files found")
         return 1
@@ -184,44 +197,48 @@ def main():
 
     print(f"Checking {len(test_files)} test file(s)...\n")
 
+    # Paths from find_test_files all start with this prefix, so slicing it
+    # off gives the path relative to src/ without going through pathlib
+    prefix_len = len(os.path.join(str(Path(args.crate_path) / 'src'), ''))
+
     # Check each test file
-    for test_file in test_files:
-        rel_path = test_file.relative_to(Path(args.crate_path) / 'src')
+    for test_file, content in found:
+        path = str(test_file)
+        rel_path = path[prefix_len:]
 
         # Check size
-        line_count, exceeds_limit = check_file_size(test_file, args.max_lines)
+        line_count, exceeds_limit = check_file_size(content, args.max_lines)
         if exceeds_limit:
             violations.append(f"{rel_path}: {line_count} lines (max: {args.max_lines})")
 
         # Check documentation
-        missing_docs = check_documentation_header(test_file)
+        missing_docs = check_documentation_header(test_file, content, args.fail_fast_docs)
         if missing_docs:
             warnings.append(f"{rel_path}: Missing documentation: {', '.join(missing_docs)}")
 
         # Check structure (location)
-        is_in_tests_dir, is_inline = check_test_structure(test_file, args.crate_path)
+        is_in_tests_dir, is_inline = check_test_structure(rel_path, path in inline_test_files)
         if is_inline and line_count > 100:
             warnings.append(f"{rel_path}: Inline tests in large file ({line_count} lines) - should move to tests/ subdirectory")
 
     # Check mirrored structure
-    missing_tests = check_mirrored_structure(args.crate_path, test_files)
+    cache = None if args.no_cache else enable_cache(args.crate_path, 'test-structure')
+    missing_tests = check_mirrored_structure(args.crate_path, rs_files, inline_test_files, cache)
 
-    # Report results
+    # Report results; each list is written in one call instead of a print per line
     exit_code = 0
 
     if violations:
         print(f"❌ VIOLATIONS: {len(violations)} test file(s) exceed size limit:")
         print("   These MUST be split (hard limit from template).\n")
-        for violation in violations:
-            print(f"  {violation}")
+        sys.stdout.write(''.join(f"  {violation}\n" for violation in violations))
         exit_code = 2
         print()
 
     if warnings:
         print(f"{'⚠️ ' if not violations else ''}WARNINGS: {len(warnings)} issue(s) found:")
         print("   These should be fixed but don't block progress.\n")
-        for warning in warnings:
-            print(f"  {warning}")
+        sys.stdout.write(''.join(f"  {warning}\n" for warning in warnings))
         if exit_code == 0:
             exit_code = 1
         print()
@@ -229,8 +246,10 @@ def main():
     if missing_tests:
         print(f"{'ℹ️ ' if exit_code == 0 else ''}INFO: {len(missing_tests)} substantial file(s) without tests:")
         print("   Consider adding test coverage.\n")
-        for item in missing_tests:  # Show all items
-            print(f"  {item['source']} ({item['lines']} lines) -> expected: {item['expected_test']}")
+        sys.stdout.write(''.join(  # Show all items
+            f"  {item['source']} ({item['lines']} lines) -> expected: {item['expected_test']}\n"
+            for item in missing_tests
+        ))
         print()
 
     if exit_code == 0:
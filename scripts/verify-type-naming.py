@@ -5,10 +5,9 @@ Verify that type names follow conventions from docs/guides/type-naming-conventio
 This script checks for:
 - Overly generic type names (Helper, Manager, Data, etc.)
 - Unnecessary 'Core' prefix on domain entities
-- Unnecessary 'multi-llm' prefix (except multi-llmError)
 
 Usage:
-    python3 scripts/verify-type-naming.py <crate-path>
+    python3 scripts/verify-type-naming.py <crate-path> [--no-cache]
 
 Example:
     python3 scripts/verify-type-naming.py multi-llm
@@ -23,49 +22,69 @@ import sys
 import re
 import argparse
 
+from verify_common import CACHE_DIR, NON_SOURCE_DIRS, enable_cache, iter_rs_files, map_files
+
 
 # Generic names to flag
-GENERIC_NAMES = {'Helper', 'Manager', 'Data', 'Utils', 'Common', 'Base'}
+GENERIC_NAMES = frozenset({'Helper', 'Manager', 'Data', 'Utils', 'Common', 'Base'})
+
+# Struct/enum/trait definitions whose name may violate a convention: one of
+# the generic names, or any name with the Core prefix. Other definitions are
+# skipped by the regex engine instead of being classified one by one. Files
+# are matched as bytes, so non-ASCII bytes count as identifier characters to
+# keep Unicode type names whole.
+VIOLATING_TYPE_DEF = re.compile(
+    rb'pub\s+(struct|enum|trait)\s+((?:'
+    + '|'.join(sorted(GENERIC_NAMES)).encode()
+    + rb')(?![\w\x80-\xff])|Core[\w\x80-\xff]*)'
+)
+
+
+def check_file(task):
+    """Return (kind, name, message) for each type naming violation in a file."""
+    path, = task
+    issues = []
 
+    with open(path, 'rb') as f:
+        content = f.read()
 
-def check_type_naming(crate_path):
-    """Check all .rs files for type naming convention violations."""
-    issues = []
-    src_path = os.path.join(crate_path, 'src')
+    # Find struct/enum/trait definitions that may violate a convention
+    for type_kind, type_name in VIOLATING_TYPE_DEF.findall(content):
+        type_kind = type_kind.decode()
+        type_name = type_name.decode('utf-8', 'replace')
 
-    if not os.path.exists(src_path):
-        print(f"Error: {src_path} does not exist", file=sys.stderr)
-        return None
+        # Check for overly generic names; no generic name has the Core
+        # prefix, so a name fails at most one check
+        if type_name in GENERIC_NAMES:
+            issues.append((type_kind, type_name,
+                           "overly generic name - use descriptive, domain-specific name"))
+
+        # Check for Core prefix on domain entities
+        elif type_name.startswith('Core'):
+            issues.append((type_kind, type_name,
+                           "avoid 'Core' prefix - use domain-specific naming"))
 
-    for root, dirs, files in os.walk(src_path):
-        for file in files:
-            if not file.endswith('.rs'):
-                continue
+    return issues
 
-            path = os.path.join(root, file)
-            rel_path = os.path.relpath(path, crate_path)
 
-            with open(path, 'r') as f:
-                content = f.read()
+def check_type_naming(crate_path, cache=None):
+    """Check all .rs files for type naming convention violations.
 
-            # Find struct/enum/trait definitions
-            type_defs = re.findall(r'pub\s+(struct|enum|trait)\s+(\w+)', content)
+    With a cache, files whose stat is unchanged since the last run are not
+    read again.
+    """
+    src_path = os.path.join(crate_path, 'src')
 
-            for type_kind, type_name in type_defs:
-                # Check for overly generic names
-                if type_name in GENERIC_NAMES:
-                    issues.append((rel_path, type_kind, type_name,
-                                 "overly generic name - use descriptive, domain-specific name"))
+    if not os.path.exists(src_path):
+        print(f"Error: {src_path} does not exist", file=sys.stderr)
+        return None
 
-                # Check for Core prefix on domain entities
-                if type_name.startswith('Core'):
-                    issues.append((rel_path, type_kind, type_name,
-                                 "avoid 'Core' prefix - use domain-specific naming"))
+    tasks = [(path,) for path, _ in iter_rs_files(src_path, NON_SOURCE_DIRS)]
 
-                # Check for multi-llm prefix (except multi-llmError)
-                if type_name.startswith('multi-llm') and type_name != 'multi-llmError':
-                    issues.append((rel_path, type_kind, type_name,
-                                 "avoid 'multi-llm' prefix - context is clear from crate"))
+    issues = []
+    for (path,), file_issues in zip(tasks, map_files(check_file, tasks, 1, cache)):
+        rel_path = os.path.relpath(path, crate_path)
+        issues.extend((rel_path, *issue) for issue in file_issues)
 
     return issues
 
@@ -78,10 +97,16 @@ def main():
         'crate_path',
         help='Path to the crate to check (e.g., multi-llm)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Do not read or write the per-file result cache in <crate>/{CACHE_DIR}'
+    )
 
     args = parser.parse_args()
 
-    issues = check_type_naming(args.crate_path)
+    cache = None if args.no_cache else enable_cache(args.crate_path, 'type-naming')
+    issues = check_type_naming(args.crate_path, cache)
 
     if issues is None:
         return 1
@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+"""
+Run the per-file source checks over a crate in a single pass.
+
+verify-file-size, verify-function-size, verify-imports and verify-file-naming
+all look at the same .rs files. This module walks src/ once, reads each file
+once and runs every requested check on that one buffer. The four scripts are
+thin wrappers that call run_checks() with just their own check; running this
+script directly performs all of them (or those selected with --size,
+--functions, --imports and --naming) and prints each report in turn.
+
+Usage:
+    python3 scripts/verify_all.py <crate-path> [--size] [--functions] [--imports] [--naming]
+        [--size-goal LINES] [--size-hard-limit LINES] [--fn-goal LINES] [--fn-hard-limit LINES]
+        [--jobs N] [--no-cache] [--only-changed REF]
+
+Example:
+    python3 scripts/verify_all.py multi-llm
+    python3 scripts/verify_all.py multi-llm --only-changed origin/main
+    python3 scripts/verify_all.py multi-llm --functions --fn-goal 40
+
+Exit codes:
+    The highest exit code any of the individual checks would return:
+    0 - All checks pass
+    1 - Goals missed / conventions violated
+    2 - Hard limits exceeded (requires approval)
+"""
+
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+from verify_common import CACHE_DIR, PARALLEL_MIN_FILES, count_lines, enable_cache, get_cache, iter_rs_files
+
+
+# Checks that need the file contents (and are cached per file)
+CONTENT_CHECKS = ('size', 'functions', 'imports')
+
+# All checks, in report order
+ALL_CHECKS = CONTENT_CHECKS + ('naming',)
+
+# Function definitions (pub fn, pub (crate) fn, async fn, const fn, etc.)
+FN_DEF = re.compile(r'(?:pub\s+(?:\(crate\)\s+)?)?(?:unsafe\s+)?(?:async\s+)?(?:const\s+)?fn\s+(\w+)')
+
+# A string or char literal, running to the end of the line if unterminated
+# (so a lifetime like 'a hides the rest of its line, as it always has)
+LITERAL = re.compile(r'"(?:\\.|[^"\\])*"?|\'(?:\\.|[^\'\\])*\'?')
+
+# Reserved file names that are expected
+RESERVED_NAMES = {'mod.rs', 'lib.rs', 'main.rs', 'error.rs', 'config.rs'}
+
+# snake_case file name, matched against the full name including '.rs'
+SNAKE_CASE_FILE = re.compile(r'^[a-z][a-z0-9_]*\.rs$')
+
+
+def decode_text(data):
+    """Decode file contents, with universal newline handling."""
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def split_lines(text):
+    """Split decoded text into lines, as readlines() would (without endings)."""
+    lines = text.split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    return lines
+
+
+def count_function_lines(text, lines):
+    """Find all functions in a file and return their sizes.
+
+    Candidate lines are located with str.find('fn') over the whole text, so
+    lines outside functions that cannot start one never reach Python code.
+    Only candidates are matched against FN_DEF, and only function bodies
+    are walked line by line to count braces; the search then resumes after
+    the body, which also skips nested functions.
+    """
+    functions = []
+    line_index = 0  # line containing `pos`
+    pos = 0
+
+    while (found := text.find('fn', pos)) != -1:
+        line_index += text.count('\n', pos, found)
+        line_start = text.rfind('\n', 0, found) + 1
+        line = lines[line_index]
+
+        match = FN_DEF.match(line.strip())
+        if not match:
+            pos = line_start + len(line)
+            continue
+
+        func_start = line_index
+        func_name = match.group(1)
+
+        # Count braces while respecting strings and comments
+        brace_count = count_braces_in_line(line)
+        pos = line_start + len(line) + 1
+        i = func_start + 1
+
+        # Count braces to find function end
+        while i < len(lines) and brace_count > 0:
+            brace_count += count_braces_in_line(lines[i])
+            pos += len(lines[i]) + 1
+            i += 1
+
+        functions.append((func_start + 1, func_name, i - func_start))
+        line_index = i
+
+    return functions
+
+
+def count_braces_in_line(line):
+    """Count net braces in a line, ignoring those in strings and comments."""
+    # Remove line comments first
+    if '//' in line:
+        line = line.split('//')[0]
+
+    # Drop string and char literals, then every remaining brace counts
+    if '"' in line or "'" in line:
+        line = LITERAL.sub('', line)
+
+    return line.count('{') - line.count('}')
+
+
+def check_inline_imports(lines):
+    """Check if a file has imports after non-import code.
+
+    Single pass over the raw bytes lines (from bytes.splitlines, which
+    splits on the same line endings as universal newlines) with the scanner
+    state held in locals; this is the hot loop of the imports check, so it
+    avoids decoding, per-line helper calls and dict lookups. Only the
+    reported import lines are decoded.
+    """
+    issues = []
+    in_imports = True
+    in_multiline_import = False
+    first_non_import_line = 0
+    just_saw_module_decl = False
+
+    for line_num, line in enumerate(lines, 1):
+        stripped = line.strip()
+
+        # Skip empty lines, comments and attributes
+        if not stripped or stripped.startswith((b'//', b'#[', b'#![')):
+            continue
+
+        # Handle multi-line imports
+        if in_multiline_import:
+            # '};' already ends with ';'
+            if stripped.endswith(b';') or stripped == b'}':
+                in_multiline_import = False
+            continue
+
+        # Module declaration with opening brace
+        if stripped.startswith((b'pub mod ', b'mod ')) and b'{' in stripped:
+            just_saw_module_decl = True
+            continue
+
+        # Handle imports
+        if stripped.startswith(b'use '):
+            # 'use super::*' directly after a module declaration is allowed
+            if just_saw_module_decl and stripped == b'use super::*;':
+                just_saw_module_decl = False
+                continue
+
+            # Track multi-line imports
+            if not stripped.endswith(b';'):
+                in_multiline_import = True
+
+            # Check if this import is misplaced
+            if (not in_imports and
+                    first_non_import_line > 0 and
+                    not just_saw_module_decl):
+                issues.append((line_num, stripped.decode('utf-8')))
+
+            just_saw_module_decl = False
+            continue
+
+        # Handle non-import lines
+        if in_imports:
+            in_imports = False
+            first_non_import_line = line_num
+        else:
+            just_saw_module_decl = False
+
+    return issues
+
+
+def check_file_name(path, file):
+    """Return naming convention issues for a single .rs file."""
+    # Skip reserved names
+    if file in RESERVED_NAMES:
+        return []
+
+    issues = []
+
+    # Check if mock file is in src/ instead of tests/
+    if '_mock.rs' in file and '/tests/' not in path:
+        issues.append("Mock file should be in tests/ directory")
+
+    # Check for snake_case (basic validation)
+    if not SNAKE_CASE_FILE.match(file):
+        issues.append("File name should be snake_case")
+
+    return issues
+
+
+def scan_file(task):
+    """Read one file and run the requested content checks on it.
+
+    Takes a (path, checks, size_limit) tuple so it can be mapped over a
+    process pool. Returns a dict of check name -> JSON-serialisable result.
+
+    When size is the only check, counting stops once size_limit lines are
+    seen; the result is then marked 'size_partial' and is a lower bound.
+    """
+    path, checks, size_limit = task
+    if checks == ['size']:
+        size, complete = count_lines(path, size_limit)
+        return {'size': size} if complete else {'size': size, 'size_partial': True}
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    result = {}
+    if 'size' in checks:
+        result['size'] = data.count(b'\n') + (0 if not data or data.endswith(b'\n') else 1)
+
+    if 'functions' in checks:
+        text = decode_text(data)
+        result['functions'] = count_function_lines(text, split_lines(text))
+
+    if 'imports' in checks:
+        result['imports'] = check_inline_imports(data.splitlines())
+
+    return result
+
+
+def changed_files(crate_path, ref):
+    """Return the crate-relative paths of .rs files under src/ changed since ref.
+
+    Covers files modified in the work tree or index relative to ref, plus
+    untracked files, so new modules are checked before they are committed.
+    Deleted files are left out. Returns None if git fails.
+    """
+    commands = [
+        ['git', '-C', crate_path, 'diff', '--name-only', '--relative',
+         '--diff-filter=d', ref, '--', 'src'],
+        ['git', '-C', crate_path, 'ls-files', '--others', '--exclude-standard', '--', 'src'],
+    ]
+    changed = set()
+    for cmd in commands:
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+        except OSError as e:
+            print(f"Error: could not run git: {e}", file=sys.stderr)
+            return None
+        if result.returncode != 0:
+            print(f"Error: {' '.join(cmd)} failed:\n{result.stderr}", file=sys.stderr, end='')
+            return None
+        changed.update(
+            os.path.normpath(p) for p in result.stdout.splitlines() if p.endswith('.rs')
+        )
+    return changed
+
+
+def collect(crate_path, checks, jobs=None, size_limit=None, only_changed=None):
+    """Walk the crate once and gather per-file results for the given checks.
+
+    size_limit lets a size-only scan stop counting a file at that many lines.
+    only_changed is a git ref; when given, only files changed since it are
+    checked.
+
+    Returns a list of (rel_path, results) in walk order, or None if the crate
+    has no src/ directory or the changed files could not be listed.
+    """
+    src_path = os.path.join(crate_path, 'src')
+
+    if not os.path.exists(src_path):
+        print(f"Error: {src_path} does not exist", file=sys.stderr)
+        return None
+
+    changed = None
+    if only_changed is not None:
+        changed = changed_files(crate_path, only_changed)
+        if changed is None:
+            return None
+
+    cache = get_cache('-'.join(sorted(c for c in checks if c in CONTENT_CHECKS)))
+    records = []
+    pending = []
+
+    # Walked paths all start with src_path, so slicing off the crate prefix
+    # gives the same relative path as os.path.relpath without its overhead
+    prefix_len = len(os.path.join(crate_path, ''))
+
+    for path, file in iter_rs_files(src_path):
+        rel_path = path[prefix_len:]
+        if changed is not None and rel_path not in changed:
+            continue
+        results = {}
+        if 'naming' in checks:
+            results['naming'] = check_file_name(path, file)
+        records.append((rel_path, results))
+
+        # Imports are not checked inside tests/ directories
+        file_checks = [c for c in CONTENT_CHECKS if c in checks]
+        if 'imports' in file_checks and 'tests' in rel_path.split(os.sep)[1:-1]:
+            file_checks.remove('imports')
+        if not file_checks:
+            continue
+
+        stamp = None
+        if cache is not None:
+            stamp, cached = cache.lookup(path)
+            if (cached is not None and all(c in cached for c in file_checks)
+                    and _partial_size_usable(cached, size_limit)):
+                results.update(cached)
+                continue
+        pending.append((results, path, stamp, file_checks))
+
+    # Scan the remaining files, in parallel when there are enough of them
+    tasks = [(path, file_checks, size_limit) for _, path, _, file_checks in pending]
+    if jobs == 1 or len(tasks) < PARALLEL_MIN_FILES:
+        scanned = list(map(scan_file, tasks))
+    else:
+        # Only import the pool when it is used; cached runs never need it
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            scanned = list(executor.map(scan_file, tasks, chunksize=32))
+
+    for (results, path, stamp, _), scan in zip(pending, scanned):
+        results.update(scan)
+        if cache is not None:
+            cache.store(path, stamp, scan)
+
+    return records
+
+
+def _partial_size_usable(cached, size_limit):
+    """Whether a cached size is exact, or a lower bound that still reaches size_limit."""
+    if not cached.get('size_partial'):
+        return True
+    return size_limit is not None and cached['size'] >= size_limit
+
+
+def check_file_sizes(records, goal, hard_limit):
+    """Split file sizes into hard limit and goal violations."""
+    file_sizes = [(p, r['size']) for p, r in records if r['size'] >= goal]
+
+    # Separate by severity
+    exceeds_hard_limit = [(p, s) for p, s in file_sizes if s >= hard_limit]
+    exceeds_goal = [(p, s) for p, s in file_sizes if s >= goal and s < hard_limit]
+
+    return exceeds_hard_limit, exceeds_goal
+
+
+def check_function_sizes(records, goal, hard_limit):
+    """Split function sizes into hard limit and goal violations."""
+    all_violations = []
+    for rel_path, results in records:
+        for line_num, func_name, length in results['functions']:
+            if length >= goal:
+                all_violations.append((rel_path, line_num, func_name, length))
+
+    # Separate by severity
+    exceeds_hard_limit = [(p, l, n, s) for p, l, n, s in all_violations if s >= hard_limit]
+    exceeds_goal = [(p, l, n, s) for p, l, n, s in all_violations if s >= goal and s < hard_limit]
+
+    return exceeds_hard_limit, exceeds_goal
+
+
+def report_file_sizes(records, goal, hard_limit):
+    """Print the file size report and return its exit code."""
+    exceeds_hard_limit, exceeds_goal = check_file_sizes(records, goal, hard_limit)
+
+    if not exceeds_hard_limit and not exceeds_goal:
+        print(f"✓ All files < {goal} lines (goal)")
+        return 0
+
+    exit_code = 0
+
+    if exceeds_hard_limit:
+        # Counting may have stopped early for these; show the lower bound
+        partial = {p for p, r in records if r.get('size_partial')}
+        print(f"❌ HARD LIMIT VIOLATION: {len(exceeds_hard_limit)} file(s) >= {hard_limit} lines:")
+        print("   These require explicit approval to ignore.\n")
+        for path, size in sorted(exceeds_hard_limit, key=lambda x: x[1], reverse=True):
+            print(f"  {path}: {size}{'+' if path in partial else ''} lines")
+        exit_code = 2
+        print()
+
+    if exceeds_goal:
+        print(f"{'⚠️ ' if not exceeds_hard_limit else ''}GOAL MISSED: {len(exceeds_goal)} file(s) >= {goal} lines but < {hard_limit} lines:")
+        print("   These should be refactored but don't block progress.\n")
+        for path, size in sorted(exceeds_goal, key=lambda x: x[1], reverse=True):
+            print(f"  {path}: {size} lines (goal: {goal}, hard limit: {hard_limit})")
+        if exit_code == 0:
+            exit_code = 1
+
+    return exit_code
+
+
+def report_function_sizes(records, goal, hard_limit):
+    """Print the function size report and return its exit code."""
+    exceeds_hard_limit, exceeds_goal = check_function_sizes(records, goal, hard_limit)
+
+    if not exceeds_hard_limit and not exceeds_goal:
+        print(f"✓ All functions < {goal} lines (goal)")
+        return 0
+
+    exit_code = 0
+
+    if exceeds_hard_limit:
+        print(f"❌ HARD LIMIT VIOLATION: {len(exceeds_hard_limit)} function(s) >= {hard_limit} lines:")
+        print("   These require explicit approval to ignore.\n")
+        for path, line, name, length in sorted(exceeds_hard_limit, key=lambda x: x[3], reverse=True)[:20]:
+            print(f"  {path}:{line} {name}() - {length} lines")
+        if len(exceeds_hard_limit) > 20:
+            print(f"\n  ... and {len(exceeds_hard_limit) - 20} more")
+        exit_code = 2
+        print()
+
+    if exceeds_goal:
+        print(f"{'⚠️ ' if not exceeds_hard_limit else ''}GOAL MISSED: {len(exceeds_goal)} function(s) >= {goal} lines but < {hard_limit} lines:")
+        print("   These should be refactored but don't block progress.\n")
+        for path, line, name, length in sorted(exceeds_goal, key=lambda x: x[3], reverse=True)[:20]:
+            print(f"  {path}:{line} {name}() - {length} lines (goal: {goal}, hard limit: {hard_limit})")
+        if len(exceeds_goal) > 20:
+            print(f"\n  ... and {len(exceeds_goal) - 20} more")
+        if exit_code == 0:
+            exit_code = 1
+
+    return exit_code
+
+
+def report_imports(records):
+    """Print the import placement report and return its exit code."""
+    violations = [(p, r['imports']) for p, r in records if r.get('imports')]
+
+    if violations:
+        print(f"❌ Found {len(violations)} file(s) with imports after code:\n")
+        for path, issues in violations[:10]:
+            print(f"  {path}:")
+            for line_num, import_stmt in issues[:3]:
+                print(f"    Line {line_num}: {import_stmt[:60]}...")
+            if len(issues) > 3:
+                print(f"    ... and {len(issues) - 3} more imports")
+        if len(violations) > 10:
+            print(f"\n  ... and {len(violations) - 10} more files")
+        return 1
+    else:
+        print("✓ All imports are at top of files")
+        return 0
+
+
+def report_file_naming(records):
+    """Print the file naming report and return its exit code."""
+    issues = [(p, msg) for p, r in records for msg in r['naming']]
+
+    if issues:
+        print(f"❌ Found {len(issues)} file naming issue(s):\n")
+        for path, msg in issues[:20]:
+            print(f"  {path}")
+            print(f"    → {msg}")
+        if len(issues) > 20:
+            print(f"\n  ... and {len(issues) - 20} more issues")
+        return 1
+    else:
+        print("✓ All files follow naming conventions")
+        return 0
+
+
+def run_checks(crate_path, checks, size_goal=500, size_hard_limit=1000,
+               fn_goal=50, fn_hard_limit=100, jobs=None, use_cache=True,
+               only_changed=None):
+    """Run the given checks in one pass and print their reports.
+
+    Returns the highest exit code of the reports, or None if the crate has
+    no src/ directory or git could not list the changed files (callers map
+    that to their own error code).
+    """
+    content_checks = [c for c in CONTENT_CHECKS if c in checks]
+    if use_cache and content_checks:
+        enable_cache(crate_path, '-'.join(sorted(content_checks)))
+
+    records = collect(crate_path, checks, jobs, size_hard_limit, only_changed)
+    if records is None:
+        return None
+
+    exit_codes = []
+    for check in ALL_CHECKS:
+        if check not in checks:
+            continue
+        if exit_codes:
+            print()
+        if check == 'size':
+            exit_codes.append(report_file_sizes(records, size_goal, size_hard_limit))
+        elif check == 'functions':
+            exit_codes.append(report_function_sizes(records, fn_goal, fn_hard_limit))
+        elif check == 'imports':
+            exit_codes.append(report_imports(records))
+        elif check == 'naming':
+            exit_codes.append(report_file_naming(records))
+
+    return max(exit_codes, default=0)
+
+
+def add_changed_argument(parser):
+    """Add the --only-changed option to a parser."""
+    parser.add_argument(
+        '--only-changed',
+        metavar='REF',
+        default=None,
+        help='Only check .rs files changed since the git ref REF (plus untracked files)'
+    )
+
+
+def add_scan_arguments(parser):
+    """Add the options controlling the shared file scan to a parser."""
+    add_changed_argument(parser)
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes for scanning files (default: CPU count, 1 = serial)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Do not read or write the per-file result cache in <crate>/{CACHE_DIR}'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run all per-file Rust source checks in a single pass'
+    )
+    parser.add_argument(
+        'crate_path',
+        help='Path to the crate to check (e.g., multi-llm)'
+    )
+    parser.add_argument(
+        '--size',
+        action='store_true',
+        help='Check file sizes (default: run every check)'
+    )
+    parser.add_argument(
+        '--functions',
+        action='store_true',
+        help='Check function sizes (default: run every check)'
+    )
+    parser.add_argument(
+        '--imports',
+        action='store_true',
+        help='Check import placement (default: run every check)'
+    )
+    parser.add_argument(
+        '--naming',
+        action='store_true',
+        help='Check file naming conventions (default: run every check)'
+    )
+    parser.add_argument(
+        '--size-goal',
+        type=int,
+        default=500,
+        help='Goal file size in lines (default: 500)'
+    )
+    parser.add_argument(
+        '--size-hard-limit',
+        type=int,
+        default=1000,
+        help='Hard limit file size in lines (default: 1000)'
+    )
+    parser.add_argument(
+        '--fn-goal',
+        type=int,
+        default=50,
+        help='Goal function size in lines (default: 50)'
+    )
+    parser.add_argument(
+        '--fn-hard-limit',
+        type=int,
+        default=100,
+        help='Hard limit function size in lines (default: 100)'
+    )
+    add_scan_arguments(parser)
+
+    args = parser.parse_args()
+
+    checks = tuple(c for c in ALL_CHECKS if getattr(args, c)) or ALL_CHECKS
+
+    exit_code = run_checks(args.crate_path, checks,
+                           size_goal=args.size_goal, size_hard_limit=args.size_hard_limit,
+                           fn_goal=args.fn_goal, fn_hard_limit=args.fn_hard_limit,
+                           jobs=args.jobs, use_cache=not args.no_cache,
+                           only_changed=args.only_changed)
+
+    if exit_code is None:
+        return 2
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""
+Shared helpers for the verify-* scripts.
+
+The scripts are run directly (python3 scripts/verify-*.py), which puts this
+directory on sys.path, so they can simply `import verify_common`.
+"""
+
+import atexit
+import json
+import os
+import sys
+from pathlib import Path
+
+
+# Read size for line counting; large enough that most files are one read
+READ_CHUNK = 1 << 20
+
+# Smaller reads when counting can stop early at a line limit
+LIMITED_READ_CHUNK = 1 << 16
+
+# Per-crate directory holding the persistent result caches
+CACHE_DIR = '.verify-cache'
+
+# Below this many files, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+# Directories under src/ that never hold crate sources (VCS metadata, tool
+# caches, JS dependencies); target is not listed since it is a valid module name
+NON_SOURCE_DIRS = frozenset({'.git', '.cache', 'node_modules'})
+
+
+def iter_rs_files(src_path, skip_dirs=()):
+    """Yield (path, name) for every .rs file under src_path.
+
+    Uses os.scandir directly so directory entries are classified from the
+    cached d_type instead of an extra stat per file. Directories whose name
+    is in skip_dirs are pruned without being opened.
+
+    Files are yielded in the same top-down order as os.walk, so reports that
+    truncate or tie-break on discovery order are unchanged.
+    """
+    stack = [src_path]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skip_dirs:
+                        subdirs.append(entry.path)
+                elif entry.name.endswith('.rs'):
+                    yield entry.path, entry.name
+        stack.extend(reversed(subdirs))
+
+
+def find_test_files(crate_path, changed=None, keep_mod_rs=False, all_rs_files=None):
+    """Find all test files in the crate.
+
+    Returns (path, content) pairs, so each file is only read once for all
+    of the checks. changed is an optional set of crate-relative paths (as
+    returned by verify_all.changed_files); other files are skipped unread.
+    mod.rs files in tests/ directories are left out unless keep_mod_rs.
+
+    Every .rs path walked is also appended to the all_rs_files list, when
+    one is given, so callers that need all sources can reuse this walk.
+    """
+    src_path = Path(crate_path) / 'src'
+
+    if not src_path.exists():
+        print(f"Error: {src_path} does not exist", file=sys.stderr)
+        return None
+
+    # One walk of src/ finds both .rs files in tests/ subdirectories and
+    # other files with #[cfg(test)]. tests/ files are listed first, each
+    # group in the preorder position of the directory holding its tests/
+    # (where the walk first enters that directory), as rglob listed them.
+    tests_dir_files = []
+    cfg_test_files = []
+    first_seen = {}
+    prefix_len = len(os.path.join(str(src_path), ''))
+    for index, (path, name) in enumerate(iter_rs_files(str(src_path), NON_SOURCE_DIRS)):
+        dirs = path[prefix_len:].split(os.sep)[:-1]
+        for depth in range(len(dirs) + 1):
+            first_seen.setdefault(tuple(dirs[:depth]), index)
+        if all_rs_files is not None:
+            all_rs_files.append(path)
+
+        in_tests = 'tests' in dirs
+        if in_tests and name == 'mod.rs' and not keep_mod_rs:
+            continue
+        if changed is not None and os.path.join('src', path[prefix_len:]) not in changed:
+            continue
+        with open(path, 'r') as f:
+            content = f.read()
+        if in_tests:
+            parent = tuple(dirs[:dirs.index('tests')])
+            tests_dir_files.append(((first_seen[parent], len(parent), index), Path(path), content))
+        elif '#[cfg(test)]' in content:
+            cfg_test_files.append((Path(path), content))
+
+    test_files = [(path, content) for _, path, content in sorted(tests_dir_files)]
+    return test_files + cfg_test_files
+
+
+def map_files(func, tasks, jobs=None, cache=None):
+    """Return [func(task) for task in tasks], where each task starts with a file path.
+
+    Runs in a process pool when there are enough tasks to run, unless jobs
+    is 1. With a cache, results for files whose stat is unchanged are reused
+    and new ones are stored, so they must be JSON-serialisable.
+    """
+    results = [None] * len(tasks)
+    pending = []
+    for i, task in enumerate(tasks):
+        stamp = None
+        if cache is not None:
+            stamp, results[i] = cache.lookup(task[0])
+            if results[i] is not None:
+                continue
+        pending.append((i, stamp))
+
+    to_run = [tasks[i] for i, _ in pending]
+    if jobs == 1 or len(to_run) < PARALLEL_MIN_FILES:
+        computed = list(map(func, to_run))
+    else:
+        # Only import the pool when it is used; cached runs never need it
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            computed = list(executor.map(func, to_run, chunksize=8))
+
+    for (i, stamp), result in zip(pending, computed):
+        results[i] = result
+        if cache is not None:
+            cache.store(tasks[i][0], stamp, result)
+    return results
+
+
+def count_lines(path, limit=None):
+    """Count lines in a file the way iterating over it in text mode would.
+
+    Counts newline bytes in binary chunks (a C-level memchr loop) instead of
+    decoding and materialising each line. A final line without a trailing
+    newline still counts as a line.
+
+    With a limit, reading stops after the first chunk that reaches it and,
+    if the file continues, the count is only a lower bound. Returns (count, complete).
+    """
+    chunk_size = READ_CHUNK if limit is None else LIMITED_READ_CHUNK
+    count = 0
+    last = b'\n'
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            count += chunk.count(b'\n')
+            last = chunk[-1:]
+            if limit is not None and count >= limit and len(chunk) == chunk_size:
+                return count, False
+    return (count if last == b'\n' else count + 1), True
+
+
+class StatCache:
+    """Per-file results persisted across runs, keyed by (mtime_ns, size).
+
+    Entries are only reused when the file's stat is unchanged and the cache
+    was written by the same version of the scripts in this directory, so
+    edits to the checks invalidate stale results.
+    """
+
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.fingerprint = _script_fingerprint()
+        self.entries = {}
+        self.dirty = False
+
+        try:
+            with open(cache_path, 'r') as f:
+                data = json.load(f)
+            if data.get('fingerprint') == self.fingerprint:
+                self.entries = data['entries']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def lookup(self, path):
+        """Return (stamp, result); result is None when there is no valid entry."""
+        st = os.stat(path)
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = self.entries.get(os.path.abspath(path))
+        if entry is not None and entry[0] == stamp:
+            return stamp, entry[1]
+        return stamp, None
+
+    def store(self, path, stamp, result):
+        """Record a result computed from the file as it was at `stamp`."""
+        self.entries[os.path.abspath(path)] = [stamp, result]
+        self.dirty = True
+
+    def save(self):
+        """Write the cache back to disk if anything changed."""
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'fingerprint': self.fingerprint, 'entries': self.entries}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"Warning: could not write {self.cache_path}: {e}", file=sys.stderr)
+        self.dirty = False
+
+
+_caches = {}
+
+
+def _script_fingerprint():
+    """Identify the current version of the verify scripts by their stat."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    stamps = []
+    for name in sorted(os.listdir(script_dir)):
+        if name.endswith('.py'):
+            st = os.stat(os.path.join(script_dir, name))
+            stamps.append([name, st.st_mtime_ns, st.st_size])
+    return stamps
+
+
+def enable_cache(crate_path, name):
+    """Load the `name` cache for a crate and save it when the process exits."""
+    cache = StatCache(os.path.join(crate_path, CACHE_DIR, f'{name}.json'))
+    _caches[name] = cache
+    atexit.register(cache.save)
+    return cache
+
+
+def get_cache(name):
+    """Return the enabled cache called `name`, or None when caching is off."""
+    return _caches.get(name)